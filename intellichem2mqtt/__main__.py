@@ -6,28 +6,36 @@ Usage:
     python -m intellichem2mqtt --help
 """
 
-import argparse
-import asyncio
 import os
 import sys
-from pathlib import Path
+from typing import Optional
 
 from . import __version__
-from .app import run_app
 from .config import create_default_config, print_env_help
 
+PROG = "intellichem2mqtt"
 
-def main() -> int:
-    """Main entry point.
+# Config file locations checked when -c is not given
+DEFAULT_CONFIG_PATHS = (
+    "/etc/intellichem2mqtt/config.yaml",
+    "/config/config.yaml",  # Docker default
+    "config.yaml",
+)
+
+USAGE = f"usage: {PROG} [-h] [-c CONFIG] [-v] [--generate-config] [--env-help]"
+
+HELP = f"""{USAGE}
+
+Pentair IntelliChem to MQTT Bridge
+
+options:
+  -h, --help            show this help message and exit
+  -c CONFIG, --config CONFIG
+                        Path to configuration file (optional if using env vars)
+  -v, --version         show program's version number and exit
+  --generate-config     Print default configuration and exit
+  --env-help            Print environment variable help and exit
 
-    Returns:
-        Exit code (0 for success, 1 for error)
-    """
-    parser = argparse.ArgumentParser(
-        prog="intellichem2mqtt",
-        description="Pentair IntelliChem to MQTT Bridge",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
   # Docker/Environment variables (no config file needed):
   MQTT_HOST=192.168.1.100 MQTT_USERNAME=user MQTT_PASSWORD=pass intellichem2mqtt
@@ -37,57 +45,91 @@ Examples:
   intellichem2mqtt --generate-config > config.yaml
 
 For more information, see: https://github.com/yourusername/intellichem2mqtt
-        """,
-    )
-
-    parser.add_argument(
-        "-c", "--config",
-        default=None,
-        help="Path to configuration file (optional if using env vars)",
-    )
-    parser.add_argument(
-        "-v", "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-    )
-    parser.add_argument(
-        "--generate-config",
-        action="store_true",
-        help="Print default configuration and exit",
-    )
-    parser.add_argument(
-        "--env-help",
-        action="store_true",
-        help="Print environment variable help and exit",
-    )
-
-    args = parser.parse_args()
+"""
+
+
+def _parse_args(argv: list[str]) -> dict:
+    """Parse command line arguments.
+
+    A minimal hand-rolled parser for the handful of supported options;
+    building an argparse parser costs more than the rest of startup.
+
+    Args:
+        argv: Arguments excluding the program name
+
+    Returns:
+        Dictionary with "config", "generate_config" and "env_help" keys
+
+    Raises:
+        SystemExit: For --help, --version or invalid arguments
+    """
+    args = {"config": None, "generate_config": False, "env_help": False}
+
+    def error(message: str) -> None:
+        print(USAGE, file=sys.stderr)
+        print(f"{PROG}: error: {message}", file=sys.stderr)
+        raise SystemExit(2)
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(HELP, end="")
+            raise SystemExit(0)
+        elif arg in ("-v", "--version"):
+            print(f"{PROG} {__version__}")
+            raise SystemExit(0)
+        elif arg == "--generate-config":
+            args["generate_config"] = True
+        elif arg == "--env-help":
+            args["env_help"] = True
+        elif arg in ("-c", "--config"):
+            i += 1
+            if i >= len(argv):
+                error("argument -c/--config: expected one argument")
+            args["config"] = argv[i]
+        elif arg.startswith("--config="):
+            args["config"] = arg[len("--config="):]
+        elif arg.startswith("-c") and len(arg) > 2:
+            args["config"] = arg[2:]
+        else:
+            error(f"unrecognized arguments: {arg}")
+        i += 1
+
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
 
     # Handle --generate-config
-    if args.generate_config:
+    if args["generate_config"]:
         print(create_default_config())
         return 0
 
     # Handle --env-help
-    if args.env_help:
+    if args["env_help"]:
         print(print_env_help())
         return 0
 
     # Determine configuration source
-    config_path = args.config
+    config_path = args["config"]
     mqtt_host = os.environ.get("MQTT_HOST")
 
     # If no config file specified, check default locations
     if not config_path:
-        default_paths = [
-            "/etc/intellichem2mqtt/config.yaml",
-            "/config/config.yaml",  # Docker default
-            "config.yaml",
-        ]
-        for path in default_paths:
-            if Path(path).exists():
-                config_path = path
-                break
+        config_path = next(
+            (path for path in DEFAULT_CONFIG_PATHS if os.path.isfile(path)),
+            None,
+        )
 
     # Log configuration source
     if config_path:
@@ -98,9 +140,18 @@ For more information, see: https://github.com/yourusername/intellichem2mqtt
         print("No MQTT_HOST configured - running in LOG-ONLY mode")
         print("Set MQTT_HOST environment variable to enable MQTT publishing")
 
-    # Run the application
+    # Run the application (imported here so the informational flags
+    # above don't pay for asyncio, serial and MQTT imports)
+    from .app import run_app
+
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop as event_loop
+    except ImportError:
+        import asyncio as event_loop
+
     try:
-        asyncio.run(run_app(config_path))
+        event_loop.run(run_app(config_path))
         return 0
     except KeyboardInterrupt:
         print("\nInterrupted by user")
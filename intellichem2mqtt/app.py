@@ -1,24 +1,62 @@
 """Main application orchestrator for Intellichem2MQTT."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import signal
-from datetime import datetime
-from typing import Optional, Union
-
-import aiomqtt
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional, Union
 
 from .config import AppConfig, get_config
-from .serial.connection import RS485Connection
-from .protocol.outbound import StatusRequestMessage
-from .protocol.inbound import StatusResponseParser
-from .mqtt.client import MQTTClient
-from .mqtt.discovery import DiscoveryManager
-from .mqtt.publisher import StatePublisher
 from .utils.logging import setup_logging
 
+# Serial, protocol and MQTT modules are imported where they are first
+# needed so that importing this module stays cheap.
+if TYPE_CHECKING:
+    from .mqtt.client import MQTTClient
+    from .mqtt.discovery import DiscoveryManager
+    from .mqtt.publisher import StatePublisher
+    from .serial.connection import RS485Connection
+
 logger = logging.getLogger(__name__)
 
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+# Upper bound for the exponential MQTT reconnect backoff, in seconds
+MQTT_RECONNECT_MAX_DELAY = 60.0
+
+# Minimum bus idle time between polls, in seconds, even when a poll
+# (e.g. a response timeout) used up the whole poll interval
+MIN_POLL_GAP = 1.0
+
+# Log-only mode status block, written as a single log record per poll
+_STATE_TEMPLATE = "\n".join([
+    "=" * 60,
+    "IntelliChem Status (LOG-ONLY MODE)",
+    "=" * 60,
+    "  pH Level:      {state.ph.level:.2f} (setpoint: {state.ph.setpoint:.1f})",
+    "  ORP Level:     {state.orp.level} mV (setpoint: {state.orp.setpoint})",
+    "  Temperature:   {state.temperature}°F",
+    "  LSI:           {state.lsi:.2f}",
+    "  Salt Level:    {state.salt_level} ppm",
+    "  Alkalinity:    {state.alkalinity} ppm",
+    "  Calcium:       {state.calcium_hardness} ppm",
+    "  Cyanuric Acid: {state.cyanuric_acid} ppm",
+    "  Flow Detected: {state.flow_detected}",
+    "  pH Tank:       {state.ph.tank_level}% ({state.ph.dosing_status})",
+    "  ORP Tank:      {state.orp.tank_level}% ({state.orp.dosing_status})",
+    "=" * 60,
+])
+
+# Log-only mode alarm line for every (flow, pH tank, ORP tank) combination
+_ALARM_MESSAGES = tuple(
+    f"  ALARMS:        Flow={bool(i & 4)}, "
+    f"pH Tank={bool(i & 2)}, ORP Tank={bool(i & 1)}"
+    for i in range(8)
+)
+
 
 class IntelliChem2MQTT:
     """Main application class.
@@ -27,12 +65,33 @@ class IntelliChem2MQTT:
     and MQTT publishing to Home Assistant.
     """
 
+    __slots__ = (
+        "config",
+        "running",
+        "_shutdown_event",
+        "_mqtt_enabled",
+        "serial",
+        "mqtt",
+        "discovery",
+        "publisher",
+        "_parse",
+        "_mqtt_reconnect_task",
+        # Statistics (plain attributes are cheaper to bump than dict items)
+        "_polls",
+        "_successful_polls",
+        "_failed_polls",
+        "_last_success",
+        "_start_time",
+    )
+
     def __init__(self, config: Union[AppConfig, str, None] = None):
         """Initialize the application.
 
         Args:
             config: AppConfig instance, path to YAML config file, or None for env/defaults
         """
+        from .protocol.inbound import StatusResponseParser
+
         if isinstance(config, AppConfig):
             self.config = config
         elif isinstance(config, str):
@@ -42,22 +101,22 @@ class IntelliChem2MQTT:
 
         self.running = False
         self._shutdown_event = asyncio.Event()
+        self._mqtt_enabled = False
 
         # Components (initialized in start())
         self.serial: Optional[RS485Connection] = None
         self.mqtt: Optional[MQTTClient] = None
         self.discovery: Optional[DiscoveryManager] = None
         self.publisher: Optional[StatePublisher] = None
-        self.parser = StatusResponseParser()
+        self._parse = StatusResponseParser.parse
+        self._mqtt_reconnect_task: Optional[asyncio.Task] = None
 
         # Statistics
-        self._stats = {
-            "polls": 0,
-            "successful_polls": 0,
-            "failed_polls": 0,
-            "last_success": None,
-            "start_time": None,
-        }
+        self._polls = 0
+        self._successful_polls = 0
+        self._failed_polls = 0
+        self._last_success: Optional[float] = None
+        self._start_time: Optional[float] = None
 
     async def start(self) -> None:
         """Start the application.
@@ -65,6 +124,8 @@ class IntelliChem2MQTT:
         Connects to serial port and MQTT broker, publishes
         discovery configs, and starts the polling loop.
         """
+        from .serial.connection import RS485Connection
+
         # Configure logging
         setup_logging(
             level=self.config.logging.level,
@@ -73,8 +134,9 @@ class IntelliChem2MQTT:
         )
 
         logger.info("Starting Intellichem2MQTT")
-        self._stats["start_time"] = datetime.now()
+        self._start_time = time.monotonic()
         self.running = True
+        self._setup_signal_handlers()
 
         # Check if MQTT is enabled
         self._mqtt_enabled = self.config.mqtt.enabled
@@ -82,12 +144,13 @@ class IntelliChem2MQTT:
             logger.info("MQTT not configured - running in LOG-ONLY mode")
             logger.info("Set MQTT_HOST environment variable to enable MQTT publishing")
 
-        # Set up signal handlers
-        self._setup_signal_handlers()
-
         try:
             # Initialize MQTT connection (if enabled)
             if self._mqtt_enabled:
+                from .mqtt.client import MQTTClient
+                from .mqtt.discovery import DiscoveryManager
+                from .mqtt.publisher import StatePublisher
+
                 self.mqtt = MQTTClient(self.config.mqtt)
                 await self.mqtt.connect()
                 await self.mqtt.publish_availability("online")
@@ -105,14 +168,15 @@ class IntelliChem2MQTT:
 
             # Start polling loop
             logger.info(
-                f"Starting poll loop (interval={self.config.intellichem.poll_interval}s)"
+                "Starting poll loop (interval=%ds)",
+                self.config.intellichem.poll_interval,
             )
             await self._poll_loop()
 
         except asyncio.CancelledError:
             logger.info("Application cancelled")
         except Exception as e:
-            logger.error(f"Application error: {e}", exc_info=True)
+            logger.error("Application error: %s", e, exc_info=True)
             raise
         finally:
             await self.stop()
@@ -123,93 +187,203 @@ class IntelliChem2MQTT:
         Periodically requests status from IntelliChem and
         publishes the results to MQTT.
         """
+        import aiomqtt
+
+        from .protocol.outbound import StatusRequestMessage
+
         poll_interval = self.config.intellichem.poll_interval
         timeout = self.config.intellichem.timeout
         address = self.config.intellichem.address
 
+        # The request never changes, so serialize it once
+        request_bytes = StatusRequestMessage(address).to_bytes()
+
+        # Bind per-poll handles to locals once; they don't change while
+        # the loop runs
+        serial = self.serial
+        parse = self._parse
+        publisher = self.publisher
+        mqtt_enabled = self._mqtt_enabled
+        shutdown_event = self._shutdown_event
+
+        # Identical responses decode to identical states, so an unchanged
+        # state is only republished every republish_interval polls
+        republish_interval = self.config.mqtt.republish_interval
+        last_published: Optional[bytes] = None
+        unchanged_polls = 0
+
+        # Single-entry parse cache: steady chemistry yields byte-identical
+        # responses, which parse to the same state
+        last_response: Optional[bytes] = None
+        last_state = None
+
+        # Set after an MQTT outage, when retained topics may be stale
+        mqtt_resync = False
+
         was_comms_lost = False
 
-        while self.running and not self._shutdown_event.is_set():
-            self._stats["polls"] += 1
+        while self.running and not shutdown_event.is_set():
+            self._polls += 1
+            poll_started = time.monotonic()
 
             try:
-                # Build and send status request
-                request = StatusRequestMessage(address)
-                await self.serial.send(request.to_bytes())
-
-                logger.debug(f"Sent status request to address {address}")
+                # Send status request
+                await serial.send(request_bytes)
 
                 # Wait for response
-                response = await self.serial.receive_packet(timeout=timeout)
+                response = await serial.receive_packet(timeout=timeout)
 
                 if response:
-                    # Parse the response
-                    state = self.parser.parse(response)
+                    # Parse the response (reusing the last result if unchanged)
+                    changed = response != last_response
+                    if changed:
+                        state = parse(response)
+                        last_response = response
+                        last_state = state
+                    else:
+                        state = last_state
 
                     if state:
-                        self._stats["successful_polls"] += 1
-                        self._stats["last_success"] = datetime.now()
-
-                        # Log compact status at INFO level
-                        logger.info(
-                            f"pH={state.ph.level:.2f} ORP={state.orp.level}mV "
-                            f"T={state.temperature}°F LSI={state.lsi:.2f} "
-                            f"flow={'Y' if state.flow_detected else 'N'}"
-                        )
-
-                        if self._mqtt_enabled:
-                            # Publish to MQTT
-                            await self.publisher.publish_state(state)
-                            logger.debug("Successfully published state to MQTT")
-
-                            # If we were in comms lost state, notify recovery
-                            if was_comms_lost:
-                                await self.publisher.publish_comms_restored()
-                                was_comms_lost = False
+                        self._successful_polls += 1
+                        self._last_success = time.monotonic()
+
+                        # Log compact status at INFO level when it changes
+                        if changed:
+                            logger.info(
+                                "pH=%.2f ORP=%smV T=%s°F LSI=%.2f flow=%s",
+                                state.ph.level,
+                                state.orp.level,
+                                state.temperature,
+                                state.lsi,
+                                "Y" if state.flow_detected else "N",
+                            )
+
+                        if mqtt_enabled:
+                            if self._mqtt_reconnecting:
+                                mqtt_resync = True
+                                logger.debug("MQTT reconnecting, skipping publish")
+                            elif (
+                                response == last_published
+                                and not was_comms_lost
+                                and not mqtt_resync
+                                and unchanged_polls + 1 < republish_interval
+                            ):
+                                unchanged_polls += 1
+                                logger.debug("State unchanged, skipping publish")
+                            else:
+                                # Publish to MQTT; periodic republishes of an
+                                # unchanged state, and the first publish after
+                                # an outage, refresh every sensor topic
+                                await publisher.publish_state(
+                                    state,
+                                    full=mqtt_resync or response == last_published,
+                                )
+                                last_published = response
+                                unchanged_polls = 0
+                                mqtt_resync = False
+
+                                # If we were in comms lost state, notify recovery
+                                if was_comms_lost:
+                                    await publisher.publish_comms_restored()
+                                    was_comms_lost = False
                         else:
                             # Log-only mode - print detailed values
                             self._log_state(state)
                     else:
                         logger.warning("Failed to parse status response")
-                        self._stats["failed_polls"] += 1
+                        self._failed_polls += 1
                 else:
                     # Timeout - no response
                     logger.warning(
-                        f"No response from IntelliChem at address {address}"
+                        "No response from IntelliChem at address %d", address
                     )
-                    self._stats["failed_polls"] += 1
-
-                    if self._mqtt_enabled and not was_comms_lost:
-                        await self.publisher.publish_comms_error()
+                    self._failed_polls += 1
+
+                    if (
+                        mqtt_enabled
+                        and not was_comms_lost
+                        and not self._mqtt_reconnecting
+                    ):
+                        # Set first so that comms restored is still sent
+                        # if this publish fails part way
                         was_comms_lost = True
+                        await publisher.publish_comms_error()
 
             except aiomqtt.MqttError as e:
-                # MQTT connection lost - attempt reconnection
-                logger.error(f"MQTT error during poll: {e}")
-                self._stats["failed_polls"] += 1
-                try:
-                    logger.info("Attempting MQTT reconnection...")
-                    await self.mqtt.reconnect()
-                    await self.mqtt.publish_availability("online")
-                    logger.info("MQTT reconnection successful")
-                except Exception as reconnect_error:
-                    logger.error(f"MQTT reconnection failed: {reconnect_error}")
+                # MQTT connection lost - reconnect in the background so that
+                # serial polling carries on during a broker outage
+                logger.error("MQTT error during poll: %s", e)
+                self._failed_polls += 1
+                mqtt_resync = True
+                if not self._mqtt_reconnecting:
+                    self._mqtt_reconnect_task = asyncio.create_task(
+                        self._reconnect_mqtt()
+                    )
 
             except Exception as e:
-                logger.error(f"Poll error: {e}")
-                self._stats["failed_polls"] += 1
+                logger.error("Poll error: %s", e)
+                self._failed_polls += 1
+
+            # Wait for next poll interval (or shutdown). The interval runs
+            # from the start of this poll, so the serial round trip and MQTT
+            # publish don't stretch the polling period, but a poll that
+            # overran it is still followed by a short gap.
+            elapsed = time.monotonic() - poll_started
+            logger.debug("Poll %d finished in %.3fs", self._polls, elapsed)
+            remaining = poll_interval - elapsed
+            if await self._wait_for_shutdown(max(remaining, MIN_POLL_GAP)):
+                break
+
+    @property
+    def _mqtt_reconnecting(self) -> bool:
+        """Check if a background MQTT reconnection is in progress."""
+        task = self._mqtt_reconnect_task
+        return task is not None and not task.done()
 
-            # Wait for next poll interval (or shutdown)
+    async def _reconnect_mqtt(self) -> None:
+        """Reconnect to the MQTT broker, retrying with exponential backoff.
+
+        Retries after 1, 2, 4, ... seconds (capped at
+        MQTT_RECONNECT_MAX_DELAY) until reconnected or shutdown.
+        """
+        delay = 1.0
+        while True:
             try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=poll_interval,
+                logger.info("Attempting MQTT reconnection...")
+                await self.mqtt.reconnect()
+                await self.mqtt.publish_availability("online")
+                logger.info("MQTT reconnection successful")
+                return
+            except Exception as e:
+                logger.error(
+                    "MQTT reconnection failed: %s (retrying in %.0fs)", e, delay
                 )
-                # If we get here, shutdown was requested
-                break
-            except asyncio.TimeoutError:
-                # Normal timeout, continue polling
-                continue
+
+            if await self._wait_for_shutdown(delay):
+                return
+            delay = min(delay * 2, MQTT_RECONNECT_MAX_DELAY)
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """Wait until shutdown is requested or the timeout expires.
+
+        Uses asyncio.timeout() where available (Python 3.11+), which
+        avoids wrapping the wait in a new Task on every poll.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if shutdown was requested, False on timeout
+        """
+        try:
+            if _HAS_ASYNCIO_TIMEOUT:
+                async with asyncio.timeout(timeout):
+                    await self._shutdown_event.wait()
+            else:
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
 
     async def stop(self) -> None:
         """Stop the application gracefully."""
@@ -217,72 +391,111 @@ class IntelliChem2MQTT:
         self.running = False
         self._shutdown_event.set()
 
-        # Publish offline status and disconnect MQTT
-        if self.mqtt:
-            try:
-                await self.mqtt.publish_availability("offline")
-                await self.mqtt.disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting MQTT: {e}")
-            self.mqtt = None
+        if self._mqtt_reconnecting:
+            self._mqtt_reconnect_task.cancel()
+            await asyncio.gather(self._mqtt_reconnect_task, return_exceptions=True)
 
-        # Disconnect serial
-        if self.serial:
-            try:
-                await self.serial.disconnect()
-            except Exception as e:
-                logger.error(f"Error disconnecting serial: {e}")
-            self.serial = None
+        # MQTT and serial are independent, so close them concurrently
+        await asyncio.gather(
+            self._disconnect_mqtt(),
+            self._disconnect_serial(),
+        )
 
         # Log statistics
         logger.info(
-            f"Statistics: polls={self._stats['polls']}, "
-            f"success={self._stats['successful_polls']}, "
-            f"failed={self._stats['failed_polls']}"
+            "Statistics: polls=%d, success=%d, failed=%d",
+            self._polls,
+            self._successful_polls,
+            self._failed_polls,
         )
         logger.info("Intellichem2MQTT stopped")
 
     def _setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
-        loop = asyncio.get_event_loop()
+        """Set up signal handlers for graceful shutdown.
+
+        SIGINT and SIGTERM cancel the current task, so a pending serial
+        read or MQTT publish is interrupted immediately instead of after
+        its timeout. stop() then runs in start()'s finally block; signals
+        received once shutdown has begun are ignored so they can't
+        interrupt it.
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
 
-        def signal_handler(sig):
-            logger.info(f"Received signal {sig.name}, initiating shutdown")
-            self._shutdown_event.set()
+        def signal_handler(sig: signal.Signals) -> None:
+            if not self.running:
+                logger.info("Received signal %s, already shutting down", sig.name)
+                return
+            logger.info("Received signal %s, initiating shutdown", sig.name)
+            self.running = False
+            task.cancel()
 
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+            loop.add_signal_handler(sig, signal_handler, sig)
+
+    async def _disconnect_mqtt(self) -> None:
+        """Publish offline status and disconnect MQTT, logging any error."""
+        if not self.mqtt:
+            return
+        try:
+            await self.mqtt.publish_availability("offline")
+            await self.mqtt.disconnect()
+        except Exception as e:
+            logger.error("Error disconnecting MQTT: %s", e)
+        self.mqtt = None
+
+    async def _disconnect_serial(self) -> None:
+        """Disconnect the serial port, logging any error."""
+        if not self.serial:
+            return
+        try:
+            await self.serial.disconnect()
+        except Exception as e:
+            logger.error("Error disconnecting serial: %s", e)
+        self.serial = None
 
     def _log_state(self, state) -> None:
         """Log IntelliChem state to console (log-only mode)."""
-        logger.info("=" * 60)
-        logger.info("IntelliChem Status (LOG-ONLY MODE)")
-        logger.info("=" * 60)
-        logger.info(f"  pH Level:      {state.ph.level:.2f} (setpoint: {state.ph.setpoint:.1f})")
-        logger.info(f"  ORP Level:     {state.orp.level} mV (setpoint: {state.orp.setpoint})")
-        logger.info(f"  Temperature:   {state.temperature}°F")
-        logger.info(f"  LSI:           {state.lsi:.2f}")
-        logger.info(f"  Salt Level:    {state.salt_level} ppm")
-        logger.info(f"  Alkalinity:    {state.alkalinity} ppm")
-        logger.info(f"  Calcium:       {state.calcium_hardness} ppm")
-        logger.info(f"  Cyanuric Acid: {state.cyanuric_acid} ppm")
-        logger.info(f"  Flow Detected: {state.flow_detected}")
-        logger.info(f"  pH Tank:       {state.ph.tank_level}% ({state.ph.dosing_status})")
-        logger.info(f"  ORP Tank:      {state.orp.tank_level}% ({state.orp.dosing_status})")
-        if state.alarms.any_active:
-            logger.warning(f"  ALARMS:        Flow={state.alarms.flow}, "
-                          f"pH Tank={state.alarms.ph_tank_empty}, "
-                          f"ORP Tank={state.alarms.orp_tank_empty}")
-        logger.info("=" * 60)
+        # Skip formatting the status block when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_STATE_TEMPLATE.format(state=state))
+        self._log_alarms(state)
+
+    @staticmethod
+    def _log_alarms(state) -> None:
+        """Log active alarms at WARNING level."""
+        alarms = state.alarms
+        if alarms.any_active:
+            logger.warning(
+                _ALARM_MESSAGES[
+                    alarms.flow << 2 | alarms.ph_tank_empty << 1 | alarms.orp_tank_empty
+                ]
+            )
 
     @property
     def stats(self) -> dict:
-        """Get application statistics."""
+        """Get application statistics.
+
+        Timestamps are tracked with time.monotonic() and only converted
+        to wall-clock datetimes here.
+        """
+        now = time.monotonic()
+        wall_now = datetime.now()
+
+        def to_wall(mono: Optional[float]) -> Optional[datetime]:
+            if mono is None:
+                return None
+            return wall_now - timedelta(seconds=now - mono)
+
         return {
-            **self._stats,
+            "polls": self._polls,
+            "successful_polls": self._successful_polls,
+            "failed_polls": self._failed_polls,
+            "last_success": to_wall(self._last_success),
+            "start_time": to_wall(self._start_time),
             "uptime": (
-                str(datetime.now() - self._stats["start_time"])
-                if self._stats["start_time"]
+                str(timedelta(seconds=now - self._start_time))
+                if self._start_time is not None
                 else None
             ),
             "serial": self.serial.stats if self.serial else None,
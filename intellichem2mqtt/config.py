@@ -6,12 +6,25 @@ Supports three configuration sources (in priority order):
 3. Default values
 """
 
+import functools
+import hashlib
+import json
 import os
+import re
+import tempfile
 from pathlib import Path
 from typing import Optional, Literal
-import yaml
 from pydantic import BaseModel, Field, field_validator
 
+from .utils.cache import cache_dir
+
+# yaml is imported where it is used: environment-only deployments and
+# loads served from the JSON cache never need it.
+
+
+# Single-character parity codes used by pyserial
+_PARITY_MAP = {"none": "N", "even": "E", "odd": "O"}
+
 
 class SerialConfig(BaseModel):
     """Serial port configuration for RS-485 connection."""
@@ -44,7 +57,9 @@ class SerialConfig(BaseModel):
     @property
     def parity_char(self) -> str:
         """Get single-character parity for pyserial."""
-        return {"none": "N", "even": "E", "odd": "O"}[self.parity]
+        return _PARITY_MAP[self.parity]
+
+    model_config = {"frozen": True}
 
 
 class IntelliChemConfig(BaseModel):
@@ -69,6 +84,8 @@ class IntelliChemConfig(BaseModel):
         description="Response timeout in seconds"
     )
 
+    model_config = {"frozen": True}
+
 
 class MQTTConfig(BaseModel):
     """MQTT broker configuration."""
@@ -119,6 +136,29 @@ class MQTTConfig(BaseModel):
         le=300,
         description="MQTT keepalive interval in seconds"
     )
+    discovery_cache: bool = Field(
+        default=False,
+        description=(
+            "Skip republishing discovery configs on startup when they are "
+            "unchanged since the last run (only safe with a persistent "
+            "broker)"
+        )
+    )
+    republish_interval: int = Field(
+        default=10,
+        ge=0,
+        description=(
+            "Republish an unchanged state every N polls "
+            "(0 = publish on every poll)"
+        )
+    )
+    payload_format: Literal["json", "msgpack"] = Field(
+        default="json",
+        description=(
+            "Also publish the full state as MessagePack on a "
+            "status.msgpack topic (requires msgspec)"
+        )
+    )
 
     @field_validator("host", "username", "password", mode="before")
     @classmethod
@@ -133,6 +173,8 @@ class MQTTConfig(BaseModel):
         """Check if MQTT is enabled (host is configured)."""
         return self.host is not None
 
+    model_config = {"frozen": True}
+
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
@@ -150,6 +192,8 @@ class LoggingConfig(BaseModel):
         description="Log message format"
     )
 
+    model_config = {"frozen": True}
+
 
 class AppConfig(BaseModel):
     """Complete application configuration."""
@@ -171,6 +215,22 @@ class AppConfig(BaseModel):
         description="Logging settings"
     )
 
+    model_config = {"frozen": True}
+
+
+# Top-level config sections and their models
+_SECTIONS = {
+    name: field.annotation for name, field in AppConfig.model_fields.items()
+}
+
+
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in _TRUTHY
+
 
 # Environment variable mapping
 ENV_MAPPING = {
@@ -191,9 +251,12 @@ ENV_MAPPING = {
     "MQTT_CLIENT_ID": ("mqtt", "client_id"),
     "MQTT_DISCOVERY_PREFIX": ("mqtt", "discovery_prefix"),
     "MQTT_TOPIC_PREFIX": ("mqtt", "topic_prefix"),
-    "MQTT_RETAIN": ("mqtt", "retain", lambda x: x.lower() in ("true", "1", "yes")),
+    "MQTT_RETAIN": ("mqtt", "retain", _parse_bool),
     "MQTT_QOS": ("mqtt", "qos", int),
     "MQTT_KEEPALIVE": ("mqtt", "keepalive", int),
+    "MQTT_REPUBLISH_INTERVAL": ("mqtt", "republish_interval", int),
+    "MQTT_DISCOVERY_CACHE": ("mqtt", "discovery_cache", _parse_bool),
+    "MQTT_PAYLOAD_FORMAT": ("mqtt", "payload_format"),
 
     # Logging
     "LOG_LEVEL": ("logging", "level"),
@@ -252,18 +315,146 @@ def load_config(config_path: str) -> AppConfig:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config validation fails
     """
-    path = Path(config_path)
+    path = Path(config_path).resolve()
 
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
 
-    with open(path, "r") as f:
-        raw_config = yaml.safe_load(f) or {}
+    # Only the environment variables the file's placeholders reference
+    # are part of the cache key
+    _, env_names = _load_raw_config(path, stat.st_mtime_ns, stat.st_size)
+    env_key = tuple(os.environ.get(name) for name in env_names)
+
+    return _load_config_cached(path, stat.st_mtime_ns, stat.st_size, env_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raw_config(
+    path: Path, mtime_ns: int, size: int
+) -> tuple[dict, tuple[str, ...]]:
+    """Load a config file version and find its environment placeholders.
+
+    Args:
+        path: Resolved path to the YAML configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed YAML content (not to be modified) and the names of the
+        environment variables it references
+    """
+    raw_config = _load_yaml(path, mtime_ns, size)
+    return raw_config, tuple(sorted(set(_env_var_names(raw_config))))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    path: Path, mtime_ns: int, size: int, env_key: tuple[Optional[str], ...]
+) -> AppConfig:
+    """Load and validate a config file version.
+
+    Cached on the file's modification time and size and the values of
+    the environment variables it references, so loading an unchanged
+    file again returns the same frozen AppConfig without re-parsing or
+    re-validating it.
+
+    Args:
+        path: Resolved path to the YAML configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        env_key: Values of the referenced environment variables
+
+    Returns:
+        Validated AppConfig instance
+    """
+    raw_config, _ = _load_raw_config(path, mtime_ns, size)
 
     # Support environment variable substitution
     raw_config = _substitute_env_vars(raw_config)
 
-    return AppConfig(**raw_config)
+    # Validate only the sections present in the file; absent sections
+    # are all defaults and need no validation
+    sections = {
+        name: (
+            model.model_validate(raw_config[name])
+            if name in raw_config
+            else model.model_construct()
+        )
+        for name, model in _SECTIONS.items()
+    }
+    return AppConfig.model_construct(**sections)
+
+
+def _yaml_cache_path(path: Path) -> Path:
+    """Get the JSON cache file for a YAML config file.
+
+    Args:
+        path: Resolved path to the YAML file
+
+    Returns:
+        Path in the cache directory, unique to the config file path
+    """
+    key = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+    return cache_dir() / f"config-{key}.json"
+
+
+def _load_yaml(path: Path, mtime_ns: int, size: int) -> dict:
+    """Load a YAML file, using a cached JSON copy when it is up to date.
+
+    The parsed YAML is cached as JSON in the cache directory together
+    with the YAML's modification time and size, and reused only while
+    both match exactly. Caching is best-effort: read and write failures
+    (e.g. no writable cache directory) fall back to parsing the YAML.
+
+    Args:
+        path: Resolved path to the YAML file
+        mtime_ns: YAML modification time in nanoseconds
+        size: YAML size in bytes
+
+    Returns:
+        Parsed YAML content (before environment variable substitution)
+    """
+    try:
+        cache_path = _yaml_cache_path(path)
+    except RuntimeError:
+        # No home directory to derive the cache directory from
+        cache_path = None
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if cached["mtime_ns"] == mtime_ns and cached["size"] == size:
+                return cached["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path, "r") as f:
+        raw_config = yaml.load(f, Loader=loader) or {}
+
+    if cache_path is not None:
+        cached = {"mtime_ns": mtime_ns, "size": size, "config": raw_config}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    return raw_config
 
 
 def get_config(config_path: Optional[str] = None) -> AppConfig:
@@ -290,63 +481,117 @@ def get_config(config_path: Optional[str] = None) -> AppConfig:
     return load_config_from_env()
 
 
+# ${VAR_NAME} or $VAR_NAME placeholders in config values, and $$ for a
+# literal "$"
+_ENV_PATTERN = re.compile(r"\$\$|\$\{(\w+)\}|\$([A-Za-z_]\w*)")
+
+
+def _env_replacement(match: "re.Match[str]") -> str:
+    """Get the environment value for a placeholder match, or leave it as is."""
+    name = match.group(1) or match.group(2)
+    if name is None:
+        return "$"
+    return os.environ.get(name, match.group(0))
+
+
+def _env_var_names(config):
+    """Yield the environment variable names referenced in config values."""
+    if isinstance(config, dict):
+        for value in config.values():
+            yield from _env_var_names(value)
+    elif isinstance(config, list):
+        for item in config:
+            yield from _env_var_names(item)
+    elif isinstance(config, str) and "$" in config:
+        for match in _ENV_PATTERN.finditer(config):
+            name = match.group(1) or match.group(2)
+            if name:
+                yield name
+
+
 def _substitute_env_vars(config: dict) -> dict:
     """Recursively substitute environment variables in config values.
 
-    Environment variables are referenced as ${VAR_NAME} or $VAR_NAME.
+    Environment variables are referenced as ${VAR_NAME} or $VAR_NAME,
+    anywhere within a string value. Unset variables are left as is, and
+    $$ is replaced by a literal "$".
     """
-    if isinstance(config, dict):
-        return {k: _substitute_env_vars(v) for k, v in config.items()}
-    elif isinstance(config, list):
-        return [_substitute_env_vars(item) for item in config]
-    elif isinstance(config, str):
-        # Handle ${VAR_NAME} format
-        if config.startswith("${") and config.endswith("}"):
-            var_name = config[2:-1]
-            return os.environ.get(var_name, config)
-        # Handle $VAR_NAME format
-        elif config.startswith("$") and not config.startswith("${"):
-            var_name = config[1:]
-            return os.environ.get(var_name, config)
-        return config
-    else:
+    substitute = _SUBSTITUTERS.get(type(config))
+    return substitute(config) if substitute else config
+
+
+def _substitute_dict(config: dict) -> dict:
+    """Substitute environment variables in dict values."""
+    return {k: _substitute_env_vars(v) for k, v in config.items()}
+
+
+def _substitute_list(config: list) -> list:
+    """Substitute environment variables in list items."""
+    return [_substitute_env_vars(item) for item in config]
+
+
+def _substitute_str(config: str) -> str:
+    """Substitute environment variables in a string."""
+    if "$" not in config:
         return config
+    return _ENV_PATTERN.sub(_env_replacement, config)
+
+
+# Parsed YAML/JSON only contains these exact container and string types,
+# so dispatch on type() instead of an isinstance() chain
+_SUBSTITUTERS = {
+    dict: _substitute_dict,
+    list: _substitute_list,
+    str: _substitute_str,
+}
 
 
+@functools.lru_cache(maxsize=None)
 def create_default_config() -> str:
-    """Generate default configuration as YAML string."""
+    """Generate default configuration as YAML string.
+
+    The output is deterministic, so it is generated once and cached.
+    """
+    import yaml
+
     config = AppConfig()
     return yaml.dump(
         config.model_dump(exclude_none=True),
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
         default_flow_style=False,
         sort_keys=False,
     )
 
 
+ENV_HELP = "\n".join([
+    "Environment Variables:",
+    "",
+    "  Serial Port:",
+    "    SERIAL_PORT          Serial device path (default: /dev/ttyUSB0)",
+    "    SERIAL_BAUDRATE      Baud rate (default: 9600)",
+    "",
+    "  IntelliChem:",
+    "    INTELLICHEM_ADDRESS       Device address 144-158 (default: 144)",
+    "    INTELLICHEM_POLL_INTERVAL Poll interval seconds (default: 30)",
+    "    INTELLICHEM_TIMEOUT       Response timeout seconds (default: 5)",
+    "",
+    "  MQTT (required for env-based config):",
+    "    MQTT_HOST             Broker hostname/IP (required)",
+    "    MQTT_PORT             Broker port (default: 1883)",
+    "    MQTT_USERNAME         Username (optional)",
+    "    MQTT_PASSWORD         Password (optional)",
+    "    MQTT_CLIENT_ID        Client ID (default: intellichem2mqtt)",
+    "    MQTT_DISCOVERY_PREFIX HA discovery prefix (default: homeassistant)",
+    "    MQTT_TOPIC_PREFIX     Topic prefix (default: intellichem2mqtt)",
+    "    MQTT_REPUBLISH_INTERVAL Republish unchanged state every N polls (default: 10)",
+    "    MQTT_DISCOVERY_CACHE  Skip unchanged discovery on restart (default: false)",
+    "    MQTT_PAYLOAD_FORMAT   json, or msgpack to add status.msgpack (default: json)",
+    "",
+    "  Logging:",
+    "    LOG_LEVEL            DEBUG, INFO, WARNING, ERROR (default: INFO)",
+])
+
+
 def print_env_help() -> str:
     """Generate help text for environment variables."""
-    lines = [
-        "Environment Variables:",
-        "",
-        "  Serial Port:",
-        "    SERIAL_PORT          Serial device path (default: /dev/ttyUSB0)",
-        "    SERIAL_BAUDRATE      Baud rate (default: 9600)",
-        "",
-        "  IntelliChem:",
-        "    INTELLICHEM_ADDRESS       Device address 144-158 (default: 144)",
-        "    INTELLICHEM_POLL_INTERVAL Poll interval seconds (default: 30)",
-        "    INTELLICHEM_TIMEOUT       Response timeout seconds (default: 5)",
-        "",
-        "  MQTT (required for env-based config):",
-        "    MQTT_HOST             Broker hostname/IP (required)",
-        "    MQTT_PORT             Broker port (default: 1883)",
-        "    MQTT_USERNAME         Username (optional)",
-        "    MQTT_PASSWORD         Password (optional)",
-        "    MQTT_CLIENT_ID        Client ID (default: intellichem2mqtt)",
-        "    MQTT_DISCOVERY_PREFIX HA discovery prefix (default: homeassistant)",
-        "    MQTT_TOPIC_PREFIX     Topic prefix (default: intellichem2mqtt)",
-        "",
-        "  Logging:",
-        "    LOG_LEVEL            DEBUG, INFO, WARNING, ERROR (default: INFO)",
-    ]
-    return "\n".join(lines)
+    return ENV_HELP
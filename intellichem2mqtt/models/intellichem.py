@@ -13,7 +13,7 @@ class DosingStatus(IntEnum):
     MIXING = 2
 
     def __str__(self) -> str:
-        return self.name.capitalize()
+        return _DOSING_NAMES[self]
 
 
 class WaterChemistry(IntEnum):
@@ -23,7 +23,15 @@ class WaterChemistry(IntEnum):
     SCALING = 2
 
     def __str__(self) -> str:
-        return self.name.capitalize()
+        return _CHEMISTRY_NAMES[self]
+
+
+# Display names, built once instead of on every str() call
+_DOSING_NAMES = {status: status.name.capitalize() for status in DosingStatus}
+_CHEMISTRY_NAMES = {status: status.name.capitalize() for status in WaterChemistry}
+
+# Tank level (0-6) to percentage
+_TANK_PCT = tuple(level / 6.0 * 100.0 for level in range(7))
 
 
 class ChemicalState(BaseModel):
@@ -65,7 +73,7 @@ class ChemicalState(BaseModel):
     @property
     def tank_level_percent(self) -> float:
         """Convert tank level to percentage (0-100)."""
-        return (self.tank_level / 6.0) * 100.0
+        return _TANK_PCT[self.tank_level]
 
     model_config = {"use_enum_values": False}
 
@@ -97,13 +105,13 @@ class Alarms(BaseModel):
     @property
     def any_active(self) -> bool:
         """Check if any alarm is active."""
-        return any([
-            self.flow,
-            self.ph_tank_empty,
-            self.orp_tank_empty,
-            self.probe_fault,
-            self.comms,
-        ])
+        return (
+            self.flow
+            or self.ph_tank_empty
+            or self.orp_tank_empty
+            or self.probe_fault
+            or self.comms
+        )
 
 
 class Warnings(BaseModel):
@@ -137,14 +145,14 @@ class Warnings(BaseModel):
     @property
     def any_active(self) -> bool:
         """Check if any warning is active."""
-        return any([
-            self.ph_lockout,
-            self.ph_daily_limit,
-            self.orp_daily_limit,
-            self.invalid_setup,
-            self.chlorinator_comm_error,
-            self.water_chemistry != WaterChemistry.OK,
-        ])
+        return (
+            self.ph_lockout
+            or self.ph_daily_limit
+            or self.orp_daily_limit
+            or self.invalid_setup
+            or self.chlorinator_comm_error
+            or self.water_chemistry != WaterChemistry.OK
+        )
 
     model_config = {"use_enum_values": False}
 
@@ -222,27 +230,32 @@ class IntelliChemState(BaseModel):
 
     def to_mqtt_dict(self) -> dict:
         """Convert state to dictionary suitable for MQTT publishing."""
+        ph = self.ph
+        orp = self.orp
+        alarms = self.alarms
+        warnings = self.warnings
+        last_update = self.last_update
         return {
             "address": self.address,
             "ph": {
-                "level": round(self.ph.level, 2),
-                "setpoint": round(self.ph.setpoint, 2),
-                "tank_level": self.ph.tank_level,
-                "tank_level_percent": round(self.ph.tank_level_percent, 1),
-                "dose_time": self.ph.dose_time,
-                "dose_volume": self.ph.dose_volume,
-                "dosing_status": str(self.ph.dosing_status),
-                "is_dosing": self.ph.is_dosing,
+                "level": round(ph.level, 2),
+                "setpoint": round(ph.setpoint, 2),
+                "tank_level": ph.tank_level,
+                "tank_level_percent": round(_TANK_PCT[ph.tank_level], 1),
+                "dose_time": ph.dose_time,
+                "dose_volume": ph.dose_volume,
+                "dosing_status": _DOSING_NAMES[ph.dosing_status],
+                "is_dosing": ph.is_dosing,
             },
             "orp": {
-                "level": self.orp.level,
-                "setpoint": self.orp.setpoint,
-                "tank_level": self.orp.tank_level,
-                "tank_level_percent": round(self.orp.tank_level_percent, 1),
-                "dose_time": self.orp.dose_time,
-                "dose_volume": self.orp.dose_volume,
-                "dosing_status": str(self.orp.dosing_status),
-                "is_dosing": self.orp.is_dosing,
+                "level": orp.level,
+                "setpoint": orp.setpoint,
+                "tank_level": orp.tank_level,
+                "tank_level_percent": round(_TANK_PCT[orp.tank_level], 1),
+                "dose_time": orp.dose_time,
+                "dose_volume": orp.dose_volume,
+                "dosing_status": _DOSING_NAMES[orp.dosing_status],
+                "is_dosing": orp.is_dosing,
             },
             "lsi": round(self.lsi, 2),
             "calcium_hardness": self.calcium_hardness,
@@ -252,25 +265,25 @@ class IntelliChemState(BaseModel):
             "temperature": self.temperature,
             "firmware": self.firmware,
             "alarms": {
-                "flow": self.alarms.flow,
-                "ph_tank_empty": self.alarms.ph_tank_empty,
-                "orp_tank_empty": self.alarms.orp_tank_empty,
-                "probe_fault": self.alarms.probe_fault,
-                "any_active": self.alarms.any_active,
+                "flow": alarms.flow,
+                "ph_tank_empty": alarms.ph_tank_empty,
+                "orp_tank_empty": alarms.orp_tank_empty,
+                "probe_fault": alarms.probe_fault,
+                "any_active": alarms.any_active,
             },
             "warnings": {
-                "ph_lockout": self.warnings.ph_lockout,
-                "ph_daily_limit": self.warnings.ph_daily_limit,
-                "orp_daily_limit": self.warnings.orp_daily_limit,
-                "invalid_setup": self.warnings.invalid_setup,
-                "chlorinator_comm_error": self.warnings.chlorinator_comm_error,
-                "water_chemistry": str(self.warnings.water_chemistry),
-                "any_active": self.warnings.any_active,
+                "ph_lockout": warnings.ph_lockout,
+                "ph_daily_limit": warnings.ph_daily_limit,
+                "orp_daily_limit": warnings.orp_daily_limit,
+                "invalid_setup": warnings.invalid_setup,
+                "chlorinator_comm_error": warnings.chlorinator_comm_error,
+                "water_chemistry": _CHEMISTRY_NAMES[warnings.water_chemistry],
+                "any_active": warnings.any_active,
             },
             "flow_detected": self.flow_detected,
             "comms_lost": self.comms_lost,
             "last_update": (
-                self.last_update.isoformat() if self.last_update else None
+                last_update.isoformat() if last_update else None
             ),
         }
 
@@ -2,15 +2,21 @@
 
 import asyncio
 import logging
-import json
-from typing import Optional, Any
+from typing import Any, Iterable, Optional
 
 import aiomqtt
 
 from ..config import MQTTConfig
+from ..utils.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded constant payloads
+_TRUE = b"true"
+_FALSE = b"false"
+_EMPTY = b""
+_AVAILABILITY = {"online": b"online", "offline": b"offline"}
+
 
 class MQTTClient:
     """Async MQTT client for Home Assistant integration.
@@ -26,6 +32,10 @@ class MQTTClient:
             config: MQTT configuration
         """
         self.config = config
+        # Config is frozen, so derived values are computed once
+        self._availability_topic = f"{config.topic_prefix}/intellichem/availability"
+        self._default_retain = config.retain
+        self._default_qos = config.qos
         self._client: Optional[aiomqtt.Client] = None
         self._connected = False
         self._reconnect_interval = 5.0
@@ -38,7 +48,7 @@ class MQTTClient:
     @property
     def availability_topic(self) -> str:
         """Get the availability topic."""
-        return f"{self.config.topic_prefix}/intellichem/availability"
+        return self._availability_topic
 
     async def connect(self) -> None:
         """Connect to the MQTT broker.
@@ -46,7 +56,9 @@ class MQTTClient:
         Raises:
             MqttError: If connection fails
         """
-        logger.info(f"Connecting to MQTT broker at {self.config.host}:{self.config.port}")
+        logger.info(
+            "Connecting to MQTT broker at %s:%d", self.config.host, self.config.port
+        )
 
         try:
             self._client = aiomqtt.Client(
@@ -66,10 +78,10 @@ class MQTTClient:
             )
             await self._client.__aenter__()
             self._connected = True
-            logger.info(f"Connected to MQTT broker (keepalive={self.config.keepalive}s)")
+            logger.info("Connected to MQTT broker (keepalive=%ds)", self.config.keepalive)
 
         except Exception as e:
-            logger.error(f"Failed to connect to MQTT broker: {e}")
+            logger.error("Failed to connect to MQTT broker: %s", e)
             raise
 
     async def disconnect(self) -> None:
@@ -77,7 +89,9 @@ class MQTTClient:
         if self._client:
             try:
                 # Publish offline status before disconnecting
-                await self.publish(self.availability_topic, "offline", retain=True)
+                await self.publish(
+                    self._availability_topic, _AVAILABILITY["offline"], retain=True
+                )
             except Exception:
                 pass
 
@@ -133,33 +147,102 @@ class MQTTClient:
 
         # Use config defaults if not specified
         if retain is None:
-            retain = self.config.retain
+            retain = self._default_retain
         if qos is None:
-            qos = self.config.qos
+            qos = self._default_qos
 
-        # Convert payload to string
-        if isinstance(payload, (dict, list)):
-            payload_str = json.dumps(payload)
-        elif isinstance(payload, bool):
-            payload_str = "true" if payload else "false"
-        elif payload is None:
-            payload_str = ""
-        else:
-            payload_str = str(payload)
+        payload_bytes = self._encode_payload(payload)
 
         try:
             await self._client.publish(
                 topic,
-                payload=payload_str,
+                payload=payload_bytes,
                 qos=qos,
                 retain=retain,
             )
-            logger.debug(f"Published to {topic}: {payload_str[:100]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Published to %s: %s",
+                    topic,
+                    payload_bytes[:100].decode(errors="replace"),
+                )
         except aiomqtt.MqttError as e:
-            logger.error(f"MQTT publish failed for {topic}: {e}")
+            logger.error("MQTT publish failed for %s: %s", topic, e)
             self._connected = False
             raise
 
+    async def publish_many(
+        self,
+        messages: Iterable[tuple[str, Any]],
+        retain: Optional[bool] = None,
+        qos: Optional[int] = None,
+    ) -> None:
+        """Publish several messages concurrently.
+
+        All messages are handed to the broker connection up front and the
+        acknowledgements (QoS > 0) are awaited together, instead of one
+        round-trip per message.
+
+        Args:
+            messages: (topic, payload) pairs; payloads are encoded as in publish()
+            retain: Whether to retain the messages (default from config)
+            qos: QoS level (default from config)
+
+        Raises:
+            ConnectionError: If not connected to MQTT broker
+            aiomqtt.MqttError: If publish fails due to connection issues
+        """
+        if not self._client or not self._connected:
+            raise ConnectionError("Not connected to MQTT broker")
+
+        if retain is None:
+            retain = self._default_retain
+        if qos is None:
+            qos = self._default_qos
+
+        publishes = [
+            self._client.publish(
+                topic,
+                payload=self._encode_payload(payload),
+                qos=qos,
+                retain=retain,
+            )
+            for topic, payload in messages
+        ]
+
+        try:
+            await asyncio.gather(*publishes)
+            logger.debug("Published %d messages", len(publishes))
+        except aiomqtt.MqttError as e:
+            logger.error("MQTT publish failed: %s", e)
+            self._connected = False
+            raise
+
+    @staticmethod
+    def _encode_payload(payload: Any) -> bytes:
+        """Convert a payload to its MQTT wire form.
+
+        Args:
+            payload: Message payload (JSON-encoded if dict/list, using
+                orjson when installed; passed through unchanged if
+                already bytes)
+
+        Returns:
+            Payload bytes
+        """
+        if isinstance(payload, bytes):
+            return payload
+        elif isinstance(payload, str):
+            return payload.encode()
+        elif isinstance(payload, (dict, list)):
+            return json_dumps(payload)
+        elif isinstance(payload, bool):
+            return _TRUE if payload else _FALSE
+        elif payload is None:
+            return _EMPTY
+        else:
+            return str(payload).encode()
+
     async def publish_json(
         self,
         topic: str,
@@ -182,11 +265,11 @@ class MQTTClient:
             status: "online" or "offline"
         """
         await self.publish(
-            self.availability_topic,
-            status,
+            self._availability_topic,
+            _AVAILABILITY.get(status, status),
             retain=True,
         )
-        logger.info(f"Published availability: {status}")
+        logger.info("Published availability: %s", status)
 
     async def subscribe(self, topic: str) -> None:
         """Subscribe to a topic.
@@ -198,7 +281,7 @@ class MQTTClient:
             raise ConnectionError("Not connected to MQTT broker")
 
         await self._client.subscribe(topic, qos=self.config.qos)
-        logger.debug(f"Subscribed to {topic}")
+        logger.debug("Subscribed to %s", topic)
 
     def topic(self, *parts: str) -> str:
         """Build a topic with the configured prefix.
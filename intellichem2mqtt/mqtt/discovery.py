@@ -1,14 +1,28 @@
 """Home Assistant MQTT Discovery configuration."""
 
+import hashlib
 import logging
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
+from .. import __version__
 from ..config import MQTTConfig
+from ..utils.cache import cache_dir
+from ..utils.serialization import json_dumps
 from .client import MQTTClient
 
 logger = logging.getLogger(__name__)
 
 
+def _discovery_cache_path() -> Path:
+    """Get the file storing the digest of the last published discovery configs.
+
+    Returns:
+        Path in the cache directory
+    """
+    return cache_dir() / "discovery.sha256"
+
+
 class DiscoveryManager:
     """Manager for Home Assistant MQTT Discovery.
 
@@ -33,6 +47,17 @@ class DiscoveryManager:
             "suggested_area": "Pool",
         }
 
+        # Discovery payloads only depend on the configuration, so they
+        # are serialized once up front
+        self._discovery_payloads: tuple[tuple[str, bytes], ...] = tuple(
+            (topic, json_dumps(config))
+            for topic, config in (
+                *self._sensor_configs(),
+                *self._binary_sensor_configs(),
+                *self._text_sensor_configs(),
+            )
+        )
+
     def _discovery_topic(self, component: str, entity_id: str) -> str:
         """Build a discovery topic.
 
@@ -75,23 +100,60 @@ class DiscoveryManager:
             "device": self._device_info,
         }
 
+    def _digest(self) -> str:
+        """Compute a digest identifying the discovery configs and broker.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(
+            f"{__version__}\n{self.config.host}:{self.config.port}\n".encode()
+        )
+        for topic, payload in self._discovery_payloads:
+            digest.update(topic.encode())
+            digest.update(payload)
+        return digest.hexdigest()
+
     async def publish_discovery_configs(self) -> None:
-        """Publish all discovery configs to Home Assistant."""
-        logger.info("Publishing Home Assistant discovery configs")
+        """Publish all discovery configs to Home Assistant.
 
-        # Sensors
-        await self._publish_sensors()
+        When discovery caching is enabled, publishing is skipped if the
+        same configs were already published (as retained messages) to
+        the same broker by a previous run.
+        """
+        digest = ""
+        cache_path: Optional[Path] = None
+
+        if self.config.discovery_cache:
+            digest = self._digest()
+            try:
+                cache_path = _discovery_cache_path()
+                if cache_path.read_text() == digest:
+                    logger.info("Discovery configs unchanged - skipping publish")
+                    return
+            except (OSError, RuntimeError):
+                pass
 
-        # Binary sensors
-        await self._publish_binary_sensors()
+        logger.info("Publishing Home Assistant discovery configs")
 
-        # Text sensors for status displays
-        await self._publish_text_sensors()
+        await self.client.publish_many(self._discovery_payloads, retain=True)
 
         logger.info("Discovery configs published")
 
-    async def _publish_sensors(self) -> None:
-        """Publish sensor discovery configs."""
+        # Cache write failures (e.g. no writable home directory) are ignored
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(digest)
+            except OSError:
+                pass
+
+    def _sensor_configs(self) -> list[tuple[str, dict[str, Any]]]:
+        """Build sensor discovery configs.
+
+        Returns:
+            List of (discovery topic, config) pairs
+        """
         sensors = [
             # pH sensors
             {
@@ -227,6 +289,7 @@ class DiscoveryManager:
             },
         ]
 
+        configs = []
         for sensor in sensors:
             config = self._base_config(sensor["name"], sensor["entity_id"])
             config["state_topic"] = sensor["state_topic"]
@@ -236,10 +299,16 @@ class DiscoveryManager:
                     config[key] = sensor[key]
 
             topic = self._discovery_topic("sensor", sensor["entity_id"])
-            await self.client.publish_json(topic, config, retain=True)
+            configs.append((topic, config))
+
+        return configs
 
-    async def _publish_binary_sensors(self) -> None:
-        """Publish binary sensor discovery configs."""
+    def _binary_sensor_configs(self) -> list[tuple[str, dict[str, Any]]]:
+        """Build binary sensor discovery configs.
+
+        Returns:
+            List of (discovery topic, config) pairs
+        """
         binary_sensors = [
             {
                 "name": "Flow Detected",
@@ -336,6 +405,7 @@ class DiscoveryManager:
             },
         ]
 
+        configs = []
         for sensor in binary_sensors:
             config = self._base_config(sensor["name"], sensor["entity_id"])
             config["state_topic"] = sensor["state_topic"]
@@ -347,10 +417,16 @@ class DiscoveryManager:
                     config[key] = sensor[key]
 
             topic = self._discovery_topic("binary_sensor", sensor["entity_id"])
-            await self.client.publish_json(topic, config, retain=True)
+            configs.append((topic, config))
 
-    async def _publish_text_sensors(self) -> None:
-        """Publish text sensor discovery configs for status displays."""
+        return configs
+
+    def _text_sensor_configs(self) -> list[tuple[str, dict[str, Any]]]:
+        """Build text sensor discovery configs for status displays.
+
+        Returns:
+            List of (discovery topic, config) pairs
+        """
         text_sensors = [
             {
                 "name": "pH Dosing Status",
@@ -372,6 +448,7 @@ class DiscoveryManager:
             },
         ]
 
+        configs = []
         for sensor in text_sensors:
             config = self._base_config(sensor["name"], sensor["entity_id"])
             config["state_topic"] = sensor["state_topic"]
@@ -379,7 +456,9 @@ class DiscoveryManager:
                 config["icon"] = sensor["icon"]
 
             topic = self._discovery_topic("sensor", sensor["entity_id"])
-            await self.client.publish_json(topic, config, retain=True)
+            configs.append((topic, config))
+
+        return configs
 
     async def remove_discovery_configs(self) -> None:
         """Remove all discovery configs from Home Assistant."""
@@ -408,4 +487,10 @@ class DiscoveryManager:
             topic = self._discovery_topic("binary_sensor", entity_id)
             await self.client.publish(topic, "", retain=True)
 
+        # Make the next publish_discovery_configs() publish again
+        try:
+            _discovery_cache_path().unlink()
+        except (OSError, RuntimeError):
+            pass
+
         logger.info("Discovery configs removed")
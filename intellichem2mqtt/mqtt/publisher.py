@@ -2,10 +2,11 @@
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from ..config import MQTTConfig
 from ..models.intellichem import IntelliChemState
+from ..utils.serialization import msgpack_encoder
 from .client import MQTTClient
 
 logger = logging.getLogger(__name__)
@@ -15,7 +16,9 @@ class StatePublisher:
     """Publisher for IntelliChem state to MQTT.
 
     Publishes both individual sensor values and a complete
-    JSON state object for flexible consumption.
+    JSON state object for flexible consumption. Individual sensor
+    topics are only republished when their value changes, unless a
+    full publish is requested.
     """
 
     def __init__(self, mqtt_client: MQTTClient, config: MQTTConfig):
@@ -24,121 +27,166 @@ class StatePublisher:
         Args:
             mqtt_client: Connected MQTT client
             config: MQTT configuration
+
+        Raises:
+            ImportError: If payload_format is msgpack and msgspec is
+                not installed
         """
         self.client = mqtt_client
         self.config = config
+        self._encode_msgpack = (
+            msgpack_encoder() if config.payload_format == "msgpack" else None
+        )
         self._last_state: Optional[IntelliChemState] = None
+        # Last payload published to each individual sensor topic
+        self._published: dict[str, Any] = {}
+        # Topic strings by path, built once and reused on every publish
+        self._topics: dict[tuple[str, ...], str] = {}
 
     def _topic(self, *path: str) -> str:
         """Build a state topic.
 
+        Topics are cached, so the same string object is returned for a
+        path every time.
+
         Args:
             path: Topic path components
 
         Returns:
             Full topic string
         """
-        return f"{self.config.topic_prefix}/intellichem/{'/'.join(path)}"
+        try:
+            return self._topics[path]
+        except KeyError:
+            topic = f"{self.config.topic_prefix}/intellichem/{'/'.join(path)}"
+            self._topics[path] = topic
+            return topic
+
+    def _status_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build the full state messages.
+
+        The state is always published as JSON, and additionally as
+        MessagePack when that payload format is enabled.
+        """
+        status = state.to_mqtt_dict()
+        messages = [(self._topic("status"), status)]
+        if self._encode_msgpack is not None:
+            messages.append(
+                (self._topic("status.msgpack"), self._encode_msgpack(status))
+            )
+        return messages
 
-    async def publish_state(self, state: IntelliChemState) -> None:
-        """Publish complete IntelliChem state.
+    async def publish_state(self, state: IntelliChemState, full: bool = False) -> None:
+        """Publish IntelliChem state.
 
-        Publishes both individual sensor topics and a complete
-        JSON state topic.
+        Publishes the complete JSON state topic plus every individual
+        sensor topic whose value changed since it was last published,
+        in a single batch.
 
         Args:
             state: Current IntelliChem state
+            full: Publish all sensor topics, even unchanged ones
         """
         # Update timestamp
         state.last_update = datetime.now()
 
-        # Publish complete JSON state
-        await self.client.publish_json(
-            self._topic("status"),
-            state.to_mqtt_dict(),
+        sensor_messages = [
+            *self._ph_messages(state),
+            *self._orp_messages(state),
+            *self._chemistry_messages(state),
+            *self._alarm_messages(state),
+            *self._warning_messages(state),
+        ]
+        published = self._published
+        if not full:
+            sensor_messages = [
+                (topic, value)
+                for topic, value in sensor_messages
+                if topic not in published or published[topic] != value
+            ]
+
+        await self.client.publish_many(
+            [*self._status_messages(state), *sensor_messages]
         )
-
-        # Publish individual sensor values
-        await self._publish_ph_state(state)
-        await self._publish_orp_state(state)
-        await self._publish_chemistry_state(state)
-        await self._publish_alarms(state)
-        await self._publish_warnings(state)
+        published.update(sensor_messages)
 
         self._last_state = state
-        logger.debug("Published IntelliChem state")
+        logger.debug(
+            "Published IntelliChem state (%d sensor topics)", len(sensor_messages)
+        )
 
-    async def _publish_ph_state(self, state: IntelliChemState) -> None:
-        """Publish pH-related state."""
+    def _ph_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build pH-related state messages."""
         ph = state.ph
 
-        await self.client.publish(self._topic("ph", "level"), round(ph.level, 2))
-        await self.client.publish(self._topic("ph", "setpoint"), round(ph.setpoint, 2))
-        await self.client.publish(self._topic("ph", "tank_level"), ph.tank_level)
-        await self.client.publish(
-            self._topic("ph", "tank_level_percent"),
-            round(ph.tank_level_percent, 1),
-        )
-        await self.client.publish(self._topic("ph", "dose_time"), ph.dose_time)
-        await self.client.publish(self._topic("ph", "dose_volume"), ph.dose_volume)
-        await self.client.publish(self._topic("ph", "dosing_status"), str(ph.dosing_status))
-        await self.client.publish(self._topic("ph", "is_dosing"), ph.is_dosing)
-
-    async def _publish_orp_state(self, state: IntelliChemState) -> None:
-        """Publish ORP-related state."""
+        return [
+            (self._topic("ph", "level"), round(ph.level, 2)),
+            (self._topic("ph", "setpoint"), round(ph.setpoint, 2)),
+            (self._topic("ph", "tank_level"), ph.tank_level),
+            (self._topic("ph", "tank_level_percent"), round(ph.tank_level_percent, 1)),
+            (self._topic("ph", "dose_time"), ph.dose_time),
+            (self._topic("ph", "dose_volume"), ph.dose_volume),
+            (self._topic("ph", "dosing_status"), str(ph.dosing_status)),
+            (self._topic("ph", "is_dosing"), ph.is_dosing),
+        ]
+
+    def _orp_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build ORP-related state messages."""
         orp = state.orp
 
-        await self.client.publish(self._topic("orp", "level"), int(orp.level))
-        await self.client.publish(self._topic("orp", "setpoint"), int(orp.setpoint))
-        await self.client.publish(self._topic("orp", "tank_level"), orp.tank_level)
-        await self.client.publish(
-            self._topic("orp", "tank_level_percent"),
-            round(orp.tank_level_percent, 1),
-        )
-        await self.client.publish(self._topic("orp", "dose_time"), orp.dose_time)
-        await self.client.publish(self._topic("orp", "dose_volume"), orp.dose_volume)
-        await self.client.publish(self._topic("orp", "dosing_status"), str(orp.dosing_status))
-        await self.client.publish(self._topic("orp", "is_dosing"), orp.is_dosing)
-
-    async def _publish_chemistry_state(self, state: IntelliChemState) -> None:
-        """Publish water chemistry state."""
-        await self.client.publish(self._topic("lsi"), round(state.lsi, 2))
-        await self.client.publish(self._topic("calcium_hardness"), state.calcium_hardness)
-        await self.client.publish(self._topic("cyanuric_acid"), state.cyanuric_acid)
-        await self.client.publish(self._topic("alkalinity"), state.alkalinity)
-        await self.client.publish(self._topic("salt_level"), state.salt_level)
-        await self.client.publish(self._topic("temperature"), state.temperature)
-        await self.client.publish(self._topic("firmware"), state.firmware)
-        await self.client.publish(self._topic("flow_detected"), state.flow_detected)
-        await self.client.publish(self._topic("comms_lost"), state.comms_lost)
-
-    async def _publish_alarms(self, state: IntelliChemState) -> None:
-        """Publish alarm states."""
+        return [
+            (self._topic("orp", "level"), int(orp.level)),
+            (self._topic("orp", "setpoint"), int(orp.setpoint)),
+            (self._topic("orp", "tank_level"), orp.tank_level),
+            (self._topic("orp", "tank_level_percent"), round(orp.tank_level_percent, 1)),
+            (self._topic("orp", "dose_time"), orp.dose_time),
+            (self._topic("orp", "dose_volume"), orp.dose_volume),
+            (self._topic("orp", "dosing_status"), str(orp.dosing_status)),
+            (self._topic("orp", "is_dosing"), orp.is_dosing),
+        ]
+
+    def _chemistry_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build water chemistry state messages."""
+        return [
+            (self._topic("lsi"), round(state.lsi, 2)),
+            (self._topic("calcium_hardness"), state.calcium_hardness),
+            (self._topic("cyanuric_acid"), state.cyanuric_acid),
+            (self._topic("alkalinity"), state.alkalinity),
+            (self._topic("salt_level"), state.salt_level),
+            (self._topic("temperature"), state.temperature),
+            (self._topic("firmware"), state.firmware),
+            (self._topic("flow_detected"), state.flow_detected),
+            (self._topic("comms_lost"), state.comms_lost),
+        ]
+
+    def _alarm_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build alarm state messages."""
         alarms = state.alarms
 
-        await self.client.publish(self._topic("alarms", "flow"), alarms.flow)
-        await self.client.publish(self._topic("alarms", "ph_tank_empty"), alarms.ph_tank_empty)
-        await self.client.publish(self._topic("alarms", "orp_tank_empty"), alarms.orp_tank_empty)
-        await self.client.publish(self._topic("alarms", "probe_fault"), alarms.probe_fault)
-        await self.client.publish(self._topic("alarms", "any_active"), alarms.any_active)
+        return [
+            (self._topic("alarms", "flow"), alarms.flow),
+            (self._topic("alarms", "ph_tank_empty"), alarms.ph_tank_empty),
+            (self._topic("alarms", "orp_tank_empty"), alarms.orp_tank_empty),
+            (self._topic("alarms", "probe_fault"), alarms.probe_fault),
+            (self._topic("alarms", "any_active"), alarms.any_active),
+        ]
 
-    async def _publish_warnings(self, state: IntelliChemState) -> None:
-        """Publish warning states."""
+    def _warning_messages(self, state: IntelliChemState) -> list[tuple[str, Any]]:
+        """Build warning state messages."""
         warnings = state.warnings
 
-        await self.client.publish(self._topic("warnings", "ph_lockout"), warnings.ph_lockout)
-        await self.client.publish(self._topic("warnings", "ph_daily_limit"), warnings.ph_daily_limit)
-        await self.client.publish(self._topic("warnings", "orp_daily_limit"), warnings.orp_daily_limit)
-        await self.client.publish(self._topic("warnings", "invalid_setup"), warnings.invalid_setup)
-        await self.client.publish(
-            self._topic("warnings", "chlorinator_comm_error"),
-            warnings.chlorinator_comm_error,
-        )
-        await self.client.publish(
-            self._topic("warnings", "water_chemistry"),
-            str(warnings.water_chemistry),
-        )
-        await self.client.publish(self._topic("warnings", "any_active"), warnings.any_active)
+        return [
+            (self._topic("warnings", "ph_lockout"), warnings.ph_lockout),
+            (self._topic("warnings", "ph_daily_limit"), warnings.ph_daily_limit),
+            (self._topic("warnings", "orp_daily_limit"), warnings.orp_daily_limit),
+            (self._topic("warnings", "invalid_setup"), warnings.invalid_setup),
+            (
+                self._topic("warnings", "chlorinator_comm_error"),
+                warnings.chlorinator_comm_error,
+            ),
+            (self._topic("warnings", "water_chemistry"), str(warnings.water_chemistry)),
+            (self._topic("warnings", "any_active"), warnings.any_active),
+        ]
 
     async def publish_comms_error(self) -> None:
         """Publish communication error state.
@@ -147,24 +195,33 @@ class StatePublisher:
         """
         logger.warning("Publishing communication error state")
 
-        await self.client.publish(self._topic("comms_lost"), True)
-        await self.client.publish(self._topic("alarms", "comms"), True)
+        messages = [
+            (self._topic("comms_lost"), True),
+            (self._topic("alarms", "comms"), True),
+        ]
 
-        # If we have a previous state, update it to show comms lost
+        # If we have a previous state, publish a copy of it showing comms
+        # lost; the original may still be reused by the caller
         if self._last_state:
-            self._last_state.comms_lost = True
-            self._last_state.alarms.comms = True
-            await self.client.publish_json(
-                self._topic("status"),
-                self._last_state.to_mqtt_dict(),
-            )
+            last_state = self._last_state
+            self._last_state = last_state.model_copy(update={
+                "comms_lost": True,
+                "alarms": last_state.alarms.model_copy(update={"comms": True}),
+            })
+            messages.extend(self._status_messages(self._last_state))
+
+        await self.client.publish_many(messages)
+        self._published[self._topic("comms_lost")] = True
 
     async def publish_comms_restored(self) -> None:
         """Publish communication restored state."""
         logger.info("Communication restored")
 
-        await self.client.publish(self._topic("comms_lost"), False)
-        await self.client.publish(self._topic("alarms", "comms"), False)
+        await self.client.publish_many([
+            (self._topic("comms_lost"), False),
+            (self._topic("alarms", "comms"), False),
+        ])
+        self._published[self._topic("comms_lost")] = False
 
     @property
     def last_state(self) -> Optional[IntelliChemState]:
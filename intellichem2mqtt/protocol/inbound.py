@@ -1,6 +1,7 @@
 """Inbound message parser for IntelliChem status responses."""
 
 import logging
+import struct
 from typing import Optional
 
 from .message import Message
@@ -31,6 +32,29 @@ from ..models.intellichem import (
 
 logger = logging.getLogger(__name__)
 
+# Status payload layout (see StatusResponseParser), decoded in one call.
+# Unused bytes are skipped with pad bytes ("x").
+_STATUS_PAYLOAD = struct.Struct(
+    ">"
+    "4H"   # 0-7:   pH level, ORP level, pH setpoint, ORP setpoint
+    "2xH"  # 10-11: pH dose time
+    "2x3H" # 14-19: ORP dose time, pH dose volume, ORP dose volume
+    "2Bb"  # 20-22: pH tank, ORP tank, LSI (signed)
+    "H"    # 23-24: Calcium hardness
+    "xB"   # 26:    Cyanuric acid
+    "HB"   # 27-29: Alkalinity, salt level / 50
+    "x8B"  # 31-38: Temperature, alarms, warnings, dosing, status,
+           #        firmware minor, firmware major, water chemistry
+)
+
+# 2-bit dosing status field; values above MIXING are treated as MIXING
+_DOSING_STATUS = (
+    DosingStatus.DOSING,
+    DosingStatus.MONITORING,
+    DosingStatus.MIXING,
+    DosingStatus.MIXING,
+)
+
 
 class StatusResponseParser:
     """Parser for IntelliChem Action 18 status response messages.
@@ -38,6 +62,9 @@ class StatusResponseParser:
     The status message contains 41 bytes of payload with pH, ORP,
     tank levels, alarms, warnings, and configuration data.
 
+    The parser is stateless; parse() is a staticmethod and can be
+    called without an instance.
+
     Payload byte mapping (from IntelliChemStateMessage.ts):
         Bytes 0-1:   pH level (Big Endian) / 100
         Bytes 2-3:   ORP level (Big Endian) mV
@@ -63,7 +90,8 @@ class StatusResponseParser:
         Byte 38:     Water chemistry (0=OK, 1=Corrosive, 2=Scaling)
     """
 
-    def parse(self, packet: bytes) -> Optional[IntelliChemState]:
+    @staticmethod
+    def parse(packet: bytes) -> Optional[IntelliChemState]:
         """Parse a complete status response packet.
 
         Args:
@@ -80,26 +108,27 @@ class StatusResponseParser:
         # Check action code
         action = Message.get_action(packet)
         if action != ACTION_STATUS_RESPONSE:
-            logger.debug(f"Not a status response (action={action})")
+            logger.debug("Not a status response (action=%d)", action)
             return None
 
         # Validate source is IntelliChem
         source = Message.get_source(packet)
         if not (INTELLICHEM_ADDRESS_MIN <= source <= INTELLICHEM_ADDRESS_MAX):
-            logger.warning(f"Invalid source address: {source}")
+            logger.warning("Invalid source address: %d", source)
             return None
 
         # Extract payload
         payload = Message.extract_payload(packet)
         if len(payload) < STATUS_PAYLOAD_LENGTH:
             logger.warning(
-                f"Payload too short: {len(payload)} < {STATUS_PAYLOAD_LENGTH}"
+                "Payload too short: %d < %d", len(payload), STATUS_PAYLOAD_LENGTH
             )
             return None
 
-        return self._parse_payload(payload, source)
+        return StatusResponseParser._parse_payload(payload, source)
 
-    def _parse_payload(self, payload: bytes, address: int) -> IntelliChemState:
+    @staticmethod
+    def _parse_payload(payload: bytes, address: int) -> IntelliChemState:
         """Parse the 41-byte status payload.
 
         Args:
@@ -109,34 +138,49 @@ class StatusResponseParser:
         Returns:
             Parsed IntelliChemState
         """
-        # Helper for big-endian 16-bit values
-        def be16(offset: int) -> int:
-            return (payload[offset] << 8) | payload[offset + 1]
+        (
+            ph_level_raw,
+            orp_level,
+            ph_setpoint_raw,
+            orp_setpoint,
+            ph_dose_time,
+            orp_dose_time,
+            ph_dose_volume,
+            orp_dose_volume,
+            ph_tank_raw,
+            orp_tank_raw,
+            lsi_raw,
+            calcium_hardness,
+            cyanuric_acid,
+            alkalinity,
+            salt_raw,
+            temperature,
+            alarm_byte,
+            warning_byte,
+            dosing_byte,
+            status_byte,
+            firmware_minor,
+            firmware_major,
+            water_chem_byte,
+        ) = _STATUS_PAYLOAD.unpack_from(payload)
 
         # Parse pH data
-        ph_level = be16(0) / 100.0
-        ph_setpoint = be16(4) / 100.0
-        ph_dose_time = be16(10)
-        ph_dose_volume = be16(16)
-        ph_tank_level = max(payload[20] - 1, 0) if payload[20] > 0 else 0
+        ph_level = ph_level_raw / 100.0
+        ph_setpoint = ph_setpoint_raw / 100.0
+        ph_tank_level = max(ph_tank_raw - 1, 0)
 
         # Parse ORP data
-        orp_level = be16(2)
-        orp_setpoint = be16(6)
-        orp_dose_time = be16(14)
-        orp_dose_volume = be16(18)
-        orp_tank_level = max(payload[21] - 1, 0) if payload[21] > 0 else 0
+        orp_tank_level = max(orp_tank_raw - 1, 0)
 
         # Parse dosing status (byte 34)
-        dosing_byte = payload[34]
         ph_doser_type = dosing_byte & 0x03
         orp_doser_type = (dosing_byte & 0x0C) >> 2
         ph_dosing_raw = (dosing_byte & 0x30) >> 4
         orp_dosing_raw = (dosing_byte & 0xC0) >> 6
 
         # Map dosing status values
-        ph_dosing_status = DosingStatus(min(ph_dosing_raw, 2))
-        orp_dosing_status = DosingStatus(min(orp_dosing_raw, 2))
+        ph_dosing_status = _DOSING_STATUS[ph_dosing_raw]
+        orp_dosing_status = _DOSING_STATUS[orp_dosing_raw]
 
         ph_state = ChemicalState(
             level=ph_level,
@@ -158,49 +202,35 @@ class StatusResponseParser:
             is_dosing=(orp_dosing_status == DosingStatus.DOSING and orp_doser_type != 0),
         )
 
-        # Parse LSI (byte 22) - signed value
-        lsi_byte = payload[22]
-        if lsi_byte & 0x80:  # High bit set = negative
-            lsi = (256 - lsi_byte) / -100.0
-        else:
-            lsi = lsi_byte / 100.0
+        # LSI (byte 22) is signed hundredths
+        lsi = lsi_raw / 100.0
+        salt_level = salt_raw * 50
 
-        # Parse water chemistry values
-        calcium_hardness = be16(23)
-        cyanuric_acid = payload[26]
-        alkalinity = be16(27)
-        salt_level = payload[29] * 50
-        temperature = payload[31]
+        # Alarms and warnings are built from plain bools and enum members,
+        # so they skip validation
 
         # Parse alarms (byte 32)
-        alarm_byte = payload[32]
-        alarms = Alarms(
+        alarms = Alarms.model_construct(
             flow=(alarm_byte & ALARM_FLOW) != 0,
             ph_tank_empty=(alarm_byte & ALARM_PH_TANK_EMPTY) != 0,
             orp_tank_empty=(alarm_byte & ALARM_ORP_TANK_EMPTY) != 0,
             probe_fault=(alarm_byte & ALARM_PROBE_FAULT) != 0,
         )
 
-        # Parse warnings (byte 33)
-        warning_byte = payload[33]
-        warnings = Warnings(
+        # Parse warnings (byte 33) and water chemistry (byte 38)
+        warnings = Warnings.model_construct(
             ph_lockout=(warning_byte & WARNING_PH_LOCKOUT) != 0,
             ph_daily_limit=(warning_byte & WARNING_PH_DAILY_LIMIT) != 0,
             orp_daily_limit=(warning_byte & WARNING_ORP_DAILY_LIMIT) != 0,
             invalid_setup=(warning_byte & WARNING_INVALID_SETUP) != 0,
             chlorinator_comm_error=(warning_byte & WARNING_CHLORINATOR_COMM) != 0,
+            water_chemistry=WaterChemistry(min(water_chem_byte, 2)),
         )
 
-        # Parse water chemistry warning (byte 38)
-        water_chem_byte = payload[38]
-        water_chemistry = WaterChemistry(min(water_chem_byte, 2))
-        warnings.water_chemistry = water_chemistry
-
         # Parse firmware (bytes 36-37)
-        firmware = f"{payload[37]}.{payload[36]:03d}"
+        firmware = f"{firmware_major}.{firmware_minor:03d}"
 
         # Parse status flags (byte 35)
-        status_byte = payload[35]
         comms_lost = (status_byte & STATUS_COMMS_LOST) != 0
 
         # Flow detected is inverse of flow alarm
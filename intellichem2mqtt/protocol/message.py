@@ -3,6 +3,12 @@
 from .constants import PREAMBLE, HEADER_START_BYTE, HEADER_SUB_BYTE
 
 
+def _checksum_bytes(data: bytes) -> bytes:
+    """Compute the 2-byte (high, low) checksum of header + payload bytes."""
+    chk = sum(data)
+    return bytes([(chk >> 8) & 0xFF, chk & 0xFF])
+
+
 class Message:
     """Base class for IntelliChem protocol messages."""
 
@@ -46,12 +52,13 @@ class Message:
     @property
     def checksum_bytes(self) -> bytes:
         """Get checksum as 2 bytes (high, low)."""
-        chk = self.checksum
-        return bytes([(chk >> 8) & 0xFF, chk & 0xFF])
+        return _checksum_bytes(self.header + self.payload)
 
     def to_bytes(self) -> bytes:
         """Serialize the complete message to bytes."""
-        return PREAMBLE + self.header + self.payload + self.checksum_bytes
+        # Build the header once; the checksum covers the same bytes
+        data = self.header + self.payload
+        return PREAMBLE + data + _checksum_bytes(data)
 
     @staticmethod
     def validate_checksum(packet: bytes) -> bool:
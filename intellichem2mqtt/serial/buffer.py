@@ -24,15 +24,22 @@ class PacketBuffer:
     # Minimum packet size: 3 preamble + 6 header + 0 payload + 2 checksum
     MIN_PACKET_SIZE = 11
 
+    __slots__ = (
+        "_buffer",
+        # Statistics (plain attributes are cheaper to bump than dict items)
+        "_packets_received",
+        "_bytes_received",
+        "_invalid_checksums",
+        "_buffer_overflows",
+    )
+
     def __init__(self):
         """Initialize an empty packet buffer."""
         self._buffer = bytearray()
-        self._stats = {
-            "packets_received": 0,
-            "bytes_received": 0,
-            "invalid_checksums": 0,
-            "buffer_overflows": 0,
-        }
+        self._packets_received = 0
+        self._bytes_received = 0
+        self._invalid_checksums = 0
+        self._buffer_overflows = 0
 
     def add_bytes(self, data: bytes) -> None:
         """Add received bytes to the buffer.
@@ -41,14 +48,14 @@ class PacketBuffer:
             data: Bytes received from serial port
         """
         self._buffer.extend(data)
-        self._stats["bytes_received"] += len(data)
+        self._bytes_received += len(data)
 
         # Prevent buffer from growing too large
         if len(self._buffer) > 4096:
             logger.warning("Buffer overflow, clearing old data")
-            self._stats["buffer_overflows"] += 1
+            self._buffer_overflows += 1
             # Keep only the last 256 bytes
-            self._buffer = self._buffer[-256:]
+            del self._buffer[:-256]
 
     def get_packet(self) -> Optional[bytes]:
         """Extract a complete packet from the buffer if available.
@@ -62,13 +69,13 @@ class PacketBuffer:
             if preamble_idx == -1:
                 # No preamble found, keep only last 2 bytes
                 if len(self._buffer) > 2:
-                    self._buffer = self._buffer[-2:]
+                    del self._buffer[:-2]
                 return None
 
             # Discard bytes before preamble
             if preamble_idx > 0:
-                logger.debug(f"Discarding {preamble_idx} bytes before preamble")
-                self._buffer = self._buffer[preamble_idx:]
+                logger.debug("Discarding %d bytes before preamble", preamble_idx)
+                del self._buffer[:preamble_idx]
 
             # Need at least MIN_PACKET_SIZE bytes
             if len(self._buffer) < self.MIN_PACKET_SIZE:
@@ -78,7 +85,7 @@ class PacketBuffer:
             if self._buffer[3] != 165:
                 # Invalid header, skip this preamble and try again
                 logger.debug("Invalid header start byte, skipping")
-                self._buffer = self._buffer[1:]
+                del self._buffer[:1]
                 continue
 
             # Get payload length from header byte 5 (index 8 in buffer)
@@ -91,21 +98,24 @@ class PacketBuffer:
             if len(self._buffer) < packet_len:
                 return None
 
-            # Extract the packet
-            packet = bytes(self._buffer[:packet_len])
+            # Extract the packet (copied once, straight out of the buffer)
+            with memoryview(self._buffer) as view:
+                packet = bytes(view[:packet_len])
 
             # Validate checksum
             if self._validate_checksum(packet):
                 # Remove packet from buffer
-                self._buffer = self._buffer[packet_len:]
-                self._stats["packets_received"] += 1
-                logger.debug(f"Valid packet received: {packet.hex()}")
+                del self._buffer[:packet_len]
+                self._packets_received += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Valid packet received: %s", packet.hex())
                 return packet
             else:
                 # Invalid checksum, skip this preamble and try again
-                logger.debug(f"Invalid checksum, skipping: {packet.hex()}")
-                self._stats["invalid_checksums"] += 1
-                self._buffer = self._buffer[1:]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Invalid checksum, skipping: %s", packet.hex())
+                self._invalid_checksums += 1
+                del self._buffer[:1]
                 continue
 
     def _find_preamble(self) -> int:
@@ -114,11 +124,7 @@ class PacketBuffer:
         Returns:
             Index of preamble start, or -1 if not found
         """
-        preamble = bytes(PREAMBLE)
-        try:
-            return self._buffer.index(preamble)
-        except ValueError:
-            return -1
+        return self._buffer.find(PREAMBLE)
 
     def _validate_checksum(self, packet: bytes) -> bool:
         """Validate the checksum of a complete packet.
@@ -148,7 +154,12 @@ class PacketBuffer:
     @property
     def stats(self) -> dict:
         """Get buffer statistics."""
-        return self._stats.copy()
+        return {
+            "packets_received": self._packets_received,
+            "bytes_received": self._bytes_received,
+            "invalid_checksums": self._invalid_checksums,
+            "buffer_overflows": self._buffer_overflows,
+        }
 
     @property
     def pending_bytes(self) -> int:
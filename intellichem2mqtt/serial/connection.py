@@ -11,6 +11,8 @@ from .buffer import PacketBuffer
 
 logger = logging.getLogger(__name__)
 
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
 
 class RS485Connection:
     """Async RS-485 serial connection manager.
@@ -44,7 +46,9 @@ class RS485Connection:
         Raises:
             SerialException: If connection fails
         """
-        logger.info(f"Connecting to {self.config.port} at {self.config.baudrate} baud")
+        logger.info(
+            "Connecting to %s at %d baud", self.config.port, self.config.baudrate
+        )
 
         try:
             self._reader, self._writer = await serial_asyncio.open_serial_connection(
@@ -55,10 +59,10 @@ class RS485Connection:
                 stopbits=self.config.stopbits,
             )
             self._connected = True
-            logger.info(f"Connected to {self.config.port}")
+            logger.info("Connected to %s", self.config.port)
 
         except Exception as e:
-            logger.error(f"Failed to connect to {self.config.port}: {e}")
+            logger.error("Failed to connect to %s: %s", self.config.port, e)
             raise
 
     async def disconnect(self) -> None:
@@ -96,7 +100,8 @@ class RS485Connection:
         if not self._writer or not self._connected:
             raise ConnectionError("Not connected to serial port")
 
-        logger.debug(f"Sending: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending: %s", data.hex())
         self._writer.write(data)
         await self._writer.drain()
 
@@ -115,32 +120,37 @@ class RS485Connection:
         if not self._reader or not self._connected:
             raise ConnectionError("Not connected to serial port")
 
-        deadline = asyncio.get_event_loop().time() + timeout
+        # One timeout around the whole read instead of a wait_for() (and,
+        # before Python 3.12, a new Task) for every chunk read
+        try:
+            if _HAS_ASYNCIO_TIMEOUT:
+                async with asyncio.timeout(timeout):
+                    return await self._read_packet()
+            return await asyncio.wait_for(self._read_packet(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug("Receive timeout - no complete packet")
+            return None
+
+    async def _read_packet(self) -> Optional[bytes]:
+        """Read from the serial port until a complete packet is assembled.
+
+        Returns:
+            Complete packet bytes, or None if the port reached EOF
+        """
+        buffer = self._buffer
+        reader = self._reader
 
-        while asyncio.get_event_loop().time() < deadline:
+        while True:
             # Check if we already have a complete packet in buffer
-            packet = self._buffer.get_packet()
+            packet = buffer.get_packet()
             if packet:
                 return packet
 
-            # Calculate remaining timeout
-            remaining = deadline - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                break
-
-            # Read more bytes with timeout
-            try:
-                data = await asyncio.wait_for(
-                    self._reader.read(256),
-                    timeout=min(remaining, 1.0),
-                )
-                if data:
-                    self._buffer.add_bytes(data)
-            except asyncio.TimeoutError:
-                continue
-
-        logger.debug("Receive timeout - no complete packet")
-        return None
+            data = await reader.read(256)
+            if not data:
+                logger.debug("Serial port closed - no complete packet")
+                return None
+            buffer.add_bytes(data)
 
     async def start_reading(
         self,
@@ -176,7 +186,7 @@ class RS485Connection:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in read loop: {e}")
+                logger.error("Error in read loop: %s", e)
                 await asyncio.sleep(1.0)
 
         logger.info("Read loop stopped")
@@ -0,0 +1,22 @@
+"""Cache directory location."""
+
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Get the directory for intellichem2mqtt cache files.
+
+    Uses $CACHE_DIRECTORY when set (systemd's CacheDirectory=, see the
+    shipped unit file), otherwise $XDG_CACHE_HOME (default ~/.cache).
+    The directory is not created.
+
+    Returns:
+        Cache directory path
+    """
+    systemd_cache = os.environ.get("CACHE_DIRECTORY")
+    if systemd_cache:
+        # systemd passes a colon-separated list for multiple directories
+        return Path(systemd_cache.split(":")[0])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "intellichem2mqtt"
@@ -56,6 +56,6 @@ def setup_logging(
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     logging.getLogger("aiomqtt").setLevel(logging.WARNING)
 
-    logging.info(f"Logging configured: level={level}")
+    logging.info("Logging configured: level=%s", level)
     if log_file:
-        logging.info(f"Log file: {log_file}")
+        logging.info("Log file: %s", log_file)
@@ -0,0 +1,47 @@
+"""Payload serialization helpers.
+
+JSON uses orjson when it is installed and falls back to the standard
+library otherwise. Both produce compact UTF-8 encoded JSON.
+MessagePack requires msgspec.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def msgpack_encoder() -> Callable[[Any], bytes]:
+    """Create a reusable MessagePack encode function.
+
+    Returns:
+        Function serializing an object to MessagePack bytes
+
+    Raises:
+        ImportError: If msgspec is not installed
+    """
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError(
+            "MessagePack payloads require msgspec "
+            "(pip install intellichem2mqtt[msgpack])"
+        ) from None
+    return msgspec.msgpack.Encoder().encode
@@ -0,0 +1,373 @@
+"""Tests for the application poll loop."""
+
+import asyncio
+import logging
+import signal
+import time
+from datetime import datetime, timedelta
+
+import aiomqtt
+
+from intellichem2mqtt.app import MIN_POLL_GAP, IntelliChem2MQTT
+from intellichem2mqtt.config import AppConfig, MQTTConfig
+from intellichem2mqtt.models.intellichem import Alarms, IntelliChemState
+from intellichem2mqtt.mqtt.publisher import StatePublisher
+from intellichem2mqtt.protocol.constants import PREAMBLE
+from intellichem2mqtt.protocol.outbound import StatusRequestMessage
+
+
+def make_packet(temperature: int) -> bytes:
+    """Create a valid status response packet."""
+    payload = bytes([0] * 31 + [temperature] + [0] * 9)
+    data = bytes([165, 0, 16, 144, 18, len(payload)]) + payload
+    checksum = sum(data)
+    return PREAMBLE + data + bytes([(checksum >> 8) & 0xFF, checksum & 0xFF])
+
+
+class FakeSerial:
+    """Serial connection returning canned responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def receive_packet(self, timeout=5.0):
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+    @property
+    def stats(self):
+        return {"connected": True}
+
+
+class FakePublisher:
+    """State publisher recording published states."""
+
+    def __init__(self, failures=0):
+        self.states = []
+        self.full = []
+        self.failures = failures
+
+    async def publish_state(self, state, full=False):
+        if self.failures:
+            self.failures -= 1
+            raise aiomqtt.MqttError("Connection lost")
+        self.states.append(state)
+        self.full.append(full)
+
+    async def publish_comms_error(self):
+        pass
+
+    async def publish_comms_restored(self):
+        pass
+
+
+class FakeMQTT:
+    """MQTT client counting reconnections."""
+
+    def __init__(self):
+        self.reconnects = 0
+
+    async def reconnect(self):
+        self.reconnects += 1
+
+    async def publish_availability(self, status):
+        pass
+
+
+class CommsErrorFailingClient:
+    """MQTT client failing the first comms error publish."""
+
+    def __init__(self):
+        self.batches = []
+        self.failed = False
+
+    async def publish_many(self, messages, retain=None, qos=None):
+        batch = dict(messages)
+        if batch.get("intellichem2mqtt/intellichem/alarms/comms") and not self.failed:
+            self.failed = True
+            raise aiomqtt.MqttError("Connection lost")
+        self.batches.append(batch)
+
+
+class PollOnceApp(IntelliChem2MQTT):
+    """App that stops once all canned responses have been polled."""
+
+    async def _wait_for_shutdown(self, timeout):
+        return not self.serial.responses
+
+
+async def run_polls(responses, republish_interval=10):
+    """Run the poll loop over the given responses and return the publisher."""
+    app = PollOnceApp(
+        AppConfig(mqtt=MQTTConfig(host="localhost", republish_interval=republish_interval))
+    )
+    app.serial = FakeSerial(responses)
+    app.publisher = FakePublisher()
+    app._mqtt_enabled = True
+    app.running = True
+
+    await app._poll_loop()
+    return app.publisher, app.serial
+
+
+class TestPollLoop:
+    """Tests for IntelliChem2MQTT._poll_loop."""
+
+    async def test_unchanged_state_not_republished(self):
+        """Test identical responses are only published once."""
+        publisher, _ = await run_polls([make_packet(80)] * 3)
+
+        assert len(publisher.states) == 1
+
+    async def test_changed_state_published(self):
+        """Test a changed response is published."""
+        publisher, _ = await run_polls([make_packet(80), make_packet(81)])
+
+        assert [s.temperature for s in publisher.states] == [80, 81]
+
+    async def test_republish_interval(self):
+        """Test an unchanged state is republished every N polls."""
+        publisher, _ = await run_polls([make_packet(80)] * 5, republish_interval=2)
+
+        # Polls 1, 3 and 5
+        assert len(publisher.states) == 3
+
+    async def test_republish_disabled(self):
+        """Test republish_interval=0 publishes every poll."""
+        publisher, _ = await run_polls([make_packet(80)] * 3, republish_interval=0)
+
+        assert len(publisher.states) == 3
+
+    async def test_identical_response_parsed_once(self):
+        """Test an unchanged response reuses the previously parsed state."""
+        app = PollOnceApp(AppConfig())
+        app.serial = FakeSerial([make_packet(80)] * 3 + [make_packet(81)])
+        app.running = True
+        parsed = []
+        parse = app._parse
+        app._parse = lambda response: parsed.append(response) or parse(response)
+
+        await app._poll_loop()
+
+        assert parsed == [make_packet(80), make_packet(81)]
+
+    async def test_unchanged_status_line_not_logged(self, caplog):
+        """Test the INFO status line is only logged when the state changes."""
+        with caplog.at_level(logging.INFO, logger="intellichem2mqtt.app"):
+            await run_polls([make_packet(80)] * 3 + [make_packet(81)])
+
+        status_lines = [r for r in caplog.records if r.getMessage().startswith("pH=")]
+        assert [r.getMessage().split()[2] for r in status_lines] == ["T=80°F", "T=81°F"]
+
+    async def test_mqtt_reconnect_in_background(self):
+        """Test polling continues and fully republishes after an MQTT error."""
+        app = PollOnceApp(AppConfig(mqtt=MQTTConfig(host="localhost")))
+        app.serial = FakeSerial([make_packet(80), make_packet(80)])
+        app.publisher = FakePublisher(failures=1)
+        app.mqtt = FakeMQTT()
+        app._mqtt_enabled = True
+        app.running = True
+
+        await app._poll_loop()
+
+        assert app.mqtt.reconnects == 1
+        assert app.publisher.full == [True]
+        assert app._failed_polls == 1
+
+    async def test_failed_comms_error_publish(self):
+        """Test a failed comms error publish doesn't leave comms lost set."""
+        config = MQTTConfig(host="localhost")
+        client = CommsErrorFailingClient()
+        app = PollOnceApp(AppConfig(mqtt=config))
+        app.serial = FakeSerial([make_packet(80), None, make_packet(80)])
+        app.publisher = StatePublisher(client, config)
+        app.mqtt = FakeMQTT()
+        app._mqtt_enabled = True
+        app.running = True
+
+        await app._poll_loop()
+
+        status, restored = client.batches[-2:]
+        assert status["intellichem2mqtt/intellichem/status"]["comms_lost"] is False
+        assert status["intellichem2mqtt/intellichem/comms_lost"] is False
+        assert restored["intellichem2mqtt/intellichem/alarms/comms"] is False
+
+    async def test_status_request_bytes(self):
+        """Test every poll sends the same serialized status request."""
+        _, serial = await run_polls([make_packet(80)] * 3)
+
+        assert serial.sent == [StatusRequestMessage(144).to_bytes()] * 3
+        assert all(sent is serial.sent[0] for sent in serial.sent)
+
+
+class RecordingWaitApp(PollOnceApp):
+    """App recording the wait after each poll."""
+
+    waits = ()
+
+    async def _wait_for_shutdown(self, timeout):
+        self.waits = (*self.waits, timeout)
+        return await super()._wait_for_shutdown(timeout)
+
+
+class TestPollInterval:
+    """Tests for the wait between polls."""
+
+    async def test_interval_from_poll_start(self):
+        """Test a quick poll waits for about the full interval."""
+        app = RecordingWaitApp(AppConfig())
+        app.serial = FakeSerial([make_packet(80)])
+        app.running = True
+
+        await app._poll_loop()
+
+        assert 59 < app.waits[0] <= 60
+
+    async def test_minimum_gap(self, monkeypatch):
+        """Test a poll overrunning the interval still leaves a gap."""
+        clock = iter(range(0, 1000, 100))
+        monkeypatch.setattr("intellichem2mqtt.app.time.monotonic", lambda: next(clock))
+        app = RecordingWaitApp(AppConfig())
+        app.serial = FakeSerial([None])
+        app.running = True
+
+        await app._poll_loop()
+
+        assert app.waits == (MIN_POLL_GAP,)
+
+
+class TestWaitForShutdown:
+    """Tests for IntelliChem2MQTT._wait_for_shutdown."""
+
+    async def test_timeout(self):
+        """Test False is returned when the interval elapses."""
+        app = IntelliChem2MQTT(AppConfig())
+
+        assert await app._wait_for_shutdown(0.01) is False
+
+    async def test_shutdown_requested(self):
+        """Test True is returned once shutdown is requested."""
+        app = IntelliChem2MQTT(AppConfig())
+        app._shutdown_event.set()
+
+        assert await app._wait_for_shutdown(10) is True
+
+    async def test_zero_timeout(self):
+        """Test an elapsed interval returns immediately."""
+        app = IntelliChem2MQTT(AppConfig())
+
+        assert await app._wait_for_shutdown(0) is False
+
+
+class SignalDuringStopApp(IntelliChem2MQTT):
+    """App receiving SIGTERM while closing the serial port."""
+
+    serial_closed = False
+
+    async def _disconnect_serial(self):
+        signal.raise_signal(signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        self.serial_closed = True
+
+
+class TestSignalHandlers:
+    """Tests for IntelliChem2MQTT._setup_signal_handlers."""
+
+    async def test_signal_logged_and_task_cancelled(self, caplog):
+        """Test SIGINT/SIGTERM log the signal and cancel the running task."""
+        app = IntelliChem2MQTT(AppConfig())
+        app.running = True
+        loop = asyncio.get_running_loop()
+
+        async def run():
+            app._setup_signal_handlers()
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(run())
+        await asyncio.sleep(0)
+        try:
+            with caplog.at_level(logging.INFO, logger="intellichem2mqtt.app"):
+                signal.raise_signal(signal.SIGTERM)
+                await asyncio.gather(task, return_exceptions=True)
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+
+        assert task.cancelled()
+        assert "Received signal SIGTERM, initiating shutdown" in caplog.text
+
+    async def test_repeated_signal_does_not_interrupt_stop(self, caplog):
+        """Test a second signal during stop() is ignored."""
+        app = SignalDuringStopApp(AppConfig())
+        app.running = True
+        loop = asyncio.get_running_loop()
+
+        async def run():
+            app._setup_signal_handlers()
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await app.stop()
+
+        task = asyncio.create_task(run())
+        await asyncio.sleep(0)
+        try:
+            with caplog.at_level(logging.INFO, logger="intellichem2mqtt.app"):
+                signal.raise_signal(signal.SIGINT)
+                await asyncio.gather(task, return_exceptions=True)
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+
+        assert task.cancelled()
+        assert app.serial_closed
+        assert "Received signal SIGTERM, already shutting down" in caplog.text
+
+
+class TestLogState:
+    """Tests for IntelliChem2MQTT._log_state."""
+
+    def test_single_record(self, caplog):
+        """Test the status block is written as one log record."""
+        app = IntelliChem2MQTT(AppConfig())
+
+        with caplog.at_level(logging.INFO, logger="intellichem2mqtt.app"):
+            app._log_state(IntelliChemState(temperature=80))
+
+        assert len(caplog.records) == 1
+        assert "Temperature:   80°F" in caplog.records[0].getMessage()
+
+    def test_alarm_line(self, caplog):
+        """Test active alarms are logged as a warning."""
+        app = IntelliChem2MQTT(AppConfig())
+        state = IntelliChemState(alarms=Alarms(flow=True, orp_tank_empty=True))
+
+        with caplog.at_level(logging.WARNING, logger="intellichem2mqtt.app"):
+            app._log_state(state)
+
+        assert caplog.records[-1].getMessage() == (
+            "  ALARMS:        Flow=True, pH Tank=False, ORP Tank=True"
+        )
+
+
+class TestStats:
+    """Tests for IntelliChem2MQTT.stats."""
+
+    async def test_timestamps_converted_on_read(self):
+        """Test monotonic poll timestamps are reported as datetimes."""
+        before = datetime.now()
+        app = PollOnceApp(AppConfig())
+        app.serial = FakeSerial([make_packet(80)])
+        app.running = True
+        app._start_time = time.monotonic()
+
+        await app._poll_loop()
+        stats = app.stats
+
+        assert stats["successful_polls"] == 1
+        assert before - timedelta(seconds=1) <= stats["last_success"] <= datetime.now()
+        assert stats["uptime"].startswith("0:00:0")
@@ -0,0 +1,58 @@
+"""Tests for command line argument parsing."""
+
+import pytest
+
+from intellichem2mqtt import __version__
+from intellichem2mqtt.__main__ import _parse_args
+
+
+class TestParseArgs:
+    """Tests for the command line parser."""
+
+    def test_defaults(self):
+        """Test defaults with no arguments."""
+        args = _parse_args([])
+
+        assert args == {"config": None, "generate_config": False, "env_help": False}
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-c", "/tmp/config.yaml"],
+            ["--config", "/tmp/config.yaml"],
+            ["--config=/tmp/config.yaml"],
+            ["-c/tmp/config.yaml"],
+        ],
+    )
+    def test_config_path(self, argv):
+        """Test all supported forms of the config option."""
+        assert _parse_args(argv)["config"] == "/tmp/config.yaml"
+
+    def test_flags(self):
+        """Test boolean flags."""
+        args = _parse_args(["--generate-config", "--env-help"])
+
+        assert args["generate_config"]
+        assert args["env_help"]
+
+    def test_version(self, capsys):
+        """Test --version prints the version and exits."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(["--version"])
+
+        assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
+
+    def test_missing_config_value(self):
+        """Test -c without a value is an error."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(["-c"])
+
+        assert exc_info.value.code == 2
+
+    def test_unknown_argument(self):
+        """Test unknown arguments are rejected."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(["--bogus"])
+
+        assert exc_info.value.code == 2
@@ -0,0 +1,62 @@
+"""Tests for the MQTT client wrapper."""
+
+import json
+import logging
+
+from intellichem2mqtt.config import MQTTConfig
+from intellichem2mqtt.mqtt.client import MQTTClient
+
+
+class TestEncodePayload:
+    """Tests for MQTTClient._encode_payload."""
+
+    def test_dict_encoded_as_json_bytes(self):
+        """Test dicts are encoded to compact JSON bytes."""
+        payload = MQTTClient._encode_payload({"ph": {"level": 7.5}, "temp": "77°F"})
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == {"ph": {"level": 7.5}, "temp": "77°F"}
+        assert b" " not in payload
+
+    def test_scalars(self):
+        """Test scalar payloads are converted to bytes."""
+        assert MQTTClient._encode_payload(True) == b"true"
+        assert MQTTClient._encode_payload(False) == b"false"
+        assert MQTTClient._encode_payload(None) == b""
+        assert MQTTClient._encode_payload(7.5) == b"7.5"
+        assert MQTTClient._encode_payload(3) == b"3"
+        assert MQTTClient._encode_payload("online") == b"online"
+        assert MQTTClient._encode_payload(b"raw") == b"raw"
+
+
+class TestAvailabilityTopic:
+    """Tests for MQTTClient.availability_topic."""
+
+    def test_built_once(self):
+        """Test the availability topic is derived from the prefix once."""
+        client = MQTTClient(MQTTConfig(topic_prefix="pool"))
+
+        assert client.availability_topic == "pool/intellichem/availability"
+        assert client.availability_topic is client.availability_topic
+
+
+class FakeAiomqttClient:
+    """aiomqtt client accepting publishes."""
+
+    async def publish(self, topic, payload=None, qos=0, retain=False):
+        pass
+
+
+class TestPublish:
+    """Tests for MQTTClient.publish."""
+
+    async def test_debug_log_decodes_payload(self, caplog):
+        """Test the debug log shows the payload text, not a bytes repr."""
+        client = MQTTClient(MQTTConfig())
+        client._client = FakeAiomqttClient()
+        client._connected = True
+
+        with caplog.at_level(logging.DEBUG, logger="intellichem2mqtt.mqtt.client"):
+            await client.publish("pool/ph", {"level": 7.5})
+
+        assert caplog.records[-1].getMessage() == 'Published to pool/ph: {"level":7.5}'
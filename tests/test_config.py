@@ -0,0 +1,159 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from intellichem2mqtt.config import (
+    MQTTConfig,
+    SerialConfig,
+    _yaml_cache_path,
+    load_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the YAML cache in a temporary directory."""
+    monkeypatch.delenv("CACHE_DIRECTORY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+class TestLoadConfig:
+    """Tests for YAML config loading."""
+
+    def test_load_yaml(self, tmp_path):
+        """Test values are read from the YAML file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+
+        config = load_config(str(config_file))
+
+        assert config.intellichem.address == 145
+
+    def test_writes_yaml_cache(self, tmp_path):
+        """Test parsed YAML is cached as JSON keyed on mtime and size."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+
+        load_config(str(config_file))
+
+        stat = config_file.stat()
+        cached = json.loads(_yaml_cache_path(config_file.resolve()).read_text())
+        assert cached == {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "config": {"intellichem": {"address": 145}},
+        }
+
+    def test_older_replacement_reparsed(self, tmp_path):
+        """Test a config replaced by a file with an older mtime is re-parsed."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+        load_config(str(config_file))
+
+        # e.g. restored with 'cp -p' from an older backup
+        stat = config_file.stat()
+        config_file.write_text("intellichem:\n  address: 146\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+        assert load_config(str(config_file)).intellichem.address == 146
+
+    def test_matching_cache_used(self, tmp_path):
+        """Test a cache matching the YAML's mtime and size is used."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+        stat = config_file.stat()
+        cache_file = _yaml_cache_path(config_file.resolve())
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(json.dumps({
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "config": {"intellichem": {"address": 150}},
+        }))
+
+        config = load_config(str(config_file))
+
+        assert config.intellichem.address == 150
+
+    def test_env_substitution(self, tmp_path, monkeypatch):
+        """Test ${VAR} and $VAR placeholders are substituted."""
+        monkeypatch.setenv("TEST_MQTT_HOST", "broker.local")
+        monkeypatch.setenv("TEST_MQTT_USER", "pool")
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "mqtt:\n"
+            "  host: ${TEST_MQTT_HOST}\n"
+            "  username: $TEST_MQTT_USER\n"
+            "  client_id: ic_${TEST_MQTT_USER}_1\n"
+            "  password: $TEST_UNSET_VAR\n"
+        )
+
+        config = load_config(str(path))
+
+        assert config.mqtt.host == "broker.local"
+        assert config.mqtt.username == "pool"
+        assert config.mqtt.client_id == "ic_pool_1"
+        assert config.mqtt.password == "$TEST_UNSET_VAR"
+
+    def test_env_substitution_escape(self, tmp_path, monkeypatch):
+        """Test $$ is read as a literal dollar sign."""
+        monkeypatch.setenv("TEST_MQTT_USER", "pool")
+        path = tmp_path / "config.yaml"
+        path.write_text("mqtt:\n  password: pa$$TEST_MQTT_USER$$\n")
+
+        config = load_config(str(path))
+
+        assert config.mqtt.password == "pa$TEST_MQTT_USER$"
+
+    def test_cache_keyed_on_referenced_env_vars(self, tmp_path, monkeypatch):
+        """Test only referenced environment variables invalidate the cache."""
+        monkeypatch.setenv("TEST_MQTT_HOST", "broker.local")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("mqtt:\n  host: ${TEST_MQTT_HOST}\n")
+        config = load_config(str(config_file))
+
+        monkeypatch.setenv("TEST_UNRELATED_VAR", "1")
+        assert load_config(str(config_file)) is config
+
+        monkeypatch.setenv("TEST_MQTT_HOST", "other.local")
+        assert load_config(str(config_file)).mqtt.host == "other.local"
+
+    def test_unchanged_file_cached(self, tmp_path):
+        """Test loading an unchanged file returns the cached config."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+
+        assert load_config(str(config_file)) is load_config(str(config_file))
+
+    def test_changed_file_reloaded(self, tmp_path):
+        """Test a modified file is loaded again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+        load_config(str(config_file))
+
+        config_file.write_text("intellichem:\n  address: 146\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_config(str(config_file)).intellichem.address == 146
+
+    def test_absent_sections_default(self, tmp_path):
+        """Test sections missing from the file get default values."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 145\n")
+
+        config = load_config(str(config_file))
+
+        assert config.serial == SerialConfig()
+        assert config.mqtt == MQTTConfig()
+
+    def test_present_section_validated(self, tmp_path):
+        """Test sections present in the file are still validated."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("intellichem:\n  address: 200\n")
+
+        with pytest.raises(ValidationError):
+            load_config(str(config_file))
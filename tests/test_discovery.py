@@ -0,0 +1,104 @@
+"""Tests for Home Assistant discovery publishing."""
+
+import pytest
+
+from intellichem2mqtt.config import MQTTConfig
+from intellichem2mqtt.mqtt.discovery import DiscoveryManager
+
+
+class FakeMQTTClient:
+    """MQTT client counting published messages."""
+
+    availability_topic = "intellichem2mqtt/availability"
+
+    def __init__(self):
+        self.published = 0
+
+    async def publish_many(self, messages, retain=None, qos=None):
+        self.published += len(messages)
+
+    async def publish(self, topic, payload, retain=None, qos=None):
+        self.published += 1
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the discovery digest cache in a temporary directory."""
+    monkeypatch.delenv("CACHE_DIRECTORY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+
+def make_discovery(**config):
+    """Create a discovery manager with a counting client."""
+    config.setdefault("discovery_cache", True)
+    client = FakeMQTTClient()
+    return DiscoveryManager(client, MQTTConfig(host="broker", **config)), client
+
+
+class TestDiscoveryCache:
+    """Tests for skipping unchanged discovery configs."""
+
+    async def test_unchanged_configs_skipped(self):
+        """Test a second run with the same configs publishes nothing."""
+        discovery, client = make_discovery()
+        await discovery.publish_discovery_configs()
+        published = client.published
+
+        discovery, client = make_discovery()
+        await discovery.publish_discovery_configs()
+
+        assert published > 0
+        assert client.published == 0
+
+    async def test_changed_configs_published(self):
+        """Test changed configs are published again."""
+        discovery, _ = make_discovery()
+        await discovery.publish_discovery_configs()
+
+        discovery, client = make_discovery(topic_prefix="pool")
+        await discovery.publish_discovery_configs()
+
+        assert client.published > 0
+
+    async def test_cache_disabled(self, tmp_path):
+        """Test configs are always published with discovery_cache=False."""
+        discovery, _ = make_discovery(discovery_cache=False)
+        await discovery.publish_discovery_configs()
+
+        discovery, client = make_discovery(discovery_cache=False)
+        await discovery.publish_discovery_configs()
+
+        assert client.published > 0
+        assert not any(tmp_path.rglob("discovery.sha256"))
+
+    async def test_cache_disabled_by_default(self):
+        """Test configs are republished on every start by default."""
+        client = FakeMQTTClient()
+        await DiscoveryManager(client, MQTTConfig(host="broker")).publish_discovery_configs()
+        published = client.published
+
+        client = FakeMQTTClient()
+        await DiscoveryManager(client, MQTTConfig(host="broker")).publish_discovery_configs()
+
+        assert client.published == published > 0
+
+    async def test_systemd_cache_directory(self, tmp_path, monkeypatch):
+        """Test the digest is stored in systemd's CacheDirectory when set."""
+        monkeypatch.setenv("CACHE_DIRECTORY", str(tmp_path / "systemd"))
+        (tmp_path / "systemd").mkdir()
+        discovery, _ = make_discovery()
+
+        await discovery.publish_discovery_configs()
+
+        assert (tmp_path / "systemd" / "discovery.sha256").exists()
+
+    async def test_remove_invalidates_cache(self):
+        """Test configs are republished after being removed."""
+        discovery, _ = make_discovery()
+        await discovery.publish_discovery_configs()
+        await discovery.remove_discovery_configs()
+
+        discovery, client = make_discovery()
+        await discovery.publish_discovery_configs()
+
+        assert client.published > 0
@@ -123,6 +123,9 @@ class TestIntelliChemState:
         assert mqtt_dict["lsi"] == 0.03
         assert mqtt_dict["temperature"] == 82
         assert mqtt_dict["firmware"] == "1.080"
+        assert mqtt_dict["ph"]["tank_level_percent"] == 83.3
+        assert mqtt_dict["ph"]["dosing_status"] == "Monitoring"
+        assert mqtt_dict["warnings"]["water_chemistry"] == "Ok"
 
     def test_to_mqtt_dict_alarms(self):
         """Test MQTT dictionary includes alarms."""
@@ -229,6 +229,16 @@ class TestStatusResponseParser:
         assert not state.alarms.any_active
         assert not state.warnings.any_active
 
+    def test_parse_without_instance(self):
+        """Test parse can be called on the class (stateless parser)."""
+        payload = bytes([0] * 31 + [82] + [0] * 9)
+
+        packet = self.create_test_packet(payload)
+        state = StatusResponseParser.parse(packet)
+
+        assert state is not None
+        assert state.temperature == 82
+
     def test_parse_negative_lsi(self):
         """Test parsing negative LSI value."""
         # Create payload with LSI = -0.30 (encoded as 256-30 = 226 with high bit set)
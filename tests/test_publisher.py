@@ -0,0 +1,146 @@
+"""Tests for MQTT state publishing."""
+
+import sys
+
+import pytest
+
+from intellichem2mqtt.config import MQTTConfig
+from intellichem2mqtt.models.intellichem import ChemicalState, IntelliChemState
+from intellichem2mqtt.mqtt.publisher import StatePublisher
+
+
+class FakeMQTTClient:
+    """MQTT client recording published messages."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def publish_many(self, messages, retain=None, qos=None):
+        self.batches.append(dict(messages))
+
+    async def publish(self, topic, payload, retain=None, qos=None):
+        self.batches.append({topic: payload})
+
+    async def publish_json(self, topic, data, retain=None):
+        await self.publish(topic, data, retain=retain)
+
+
+def make_publisher():
+    """Create a publisher with a recording client."""
+    client = FakeMQTTClient()
+    return StatePublisher(client, MQTTConfig()), client
+
+
+class TestStatePublisher:
+    """Tests for StatePublisher."""
+
+    async def test_first_publish_is_full(self):
+        """Test all sensor topics are published the first time."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+
+        batch = client.batches[0]
+        assert "intellichem2mqtt/intellichem/status" in batch
+        assert "intellichem2mqtt/intellichem/ph/level" in batch
+        assert "intellichem2mqtt/intellichem/warnings/any_active" in batch
+
+    async def test_only_changed_topics_published(self):
+        """Test unchanged sensor topics are skipped."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState(temperature=80))
+        await publisher.publish_state(IntelliChemState(temperature=81))
+
+        assert set(client.batches[1]) == {
+            "intellichem2mqtt/intellichem/status",
+            "intellichem2mqtt/intellichem/temperature",
+        }
+
+    async def test_full_publish(self):
+        """Test full=True republishes unchanged topics."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+        await publisher.publish_state(IntelliChemState(), full=True)
+
+        assert client.batches[1].keys() == client.batches[0].keys()
+
+    async def test_rounded_values_compared(self):
+        """Test changes hidden by rounding are not republished."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState(ph=ChemicalState(level=7.501)))
+        await publisher.publish_state(IntelliChemState(ph=ChemicalState(level=7.502)))
+
+        assert "intellichem2mqtt/intellichem/ph/level" not in client.batches[1]
+
+    async def test_comms_lost_cleared_after_restore(self):
+        """Test comms_lost is republished after a communication error."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+        await publisher.publish_comms_error()
+        await publisher.publish_state(IntelliChemState())
+
+        assert client.batches[-1]["intellichem2mqtt/intellichem/comms_lost"] is False
+
+    async def test_topics_reused(self):
+        """Test sensor topic strings are built once and reused."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+        await publisher.publish_state(IntelliChemState(), full=True)
+
+        first, second = client.batches
+        assert all(a is b for a, b in zip(first, second))
+
+    async def test_comms_error_single_batch(self):
+        """Test the comms error state is published in one batch."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+        await publisher.publish_comms_error()
+
+        assert client.batches[-1]["intellichem2mqtt/intellichem/comms_lost"] is True
+        assert client.batches[-1]["intellichem2mqtt/intellichem/alarms/comms"] is True
+        assert client.batches[-1]["intellichem2mqtt/intellichem/status"]["comms_lost"] is True
+
+    async def test_comms_error_leaves_state_unchanged(self):
+        """Test the comms error is published from a copy of the last state."""
+        publisher, client = make_publisher()
+        state = IntelliChemState()
+
+        await publisher.publish_state(state)
+        await publisher.publish_comms_error()
+
+        assert state.comms_lost is False
+        assert state.alarms.comms is False
+        assert publisher.last_state.alarms.comms is True
+
+    async def test_json_only_by_default(self):
+        """Test no MessagePack topic is published by default."""
+        publisher, client = make_publisher()
+
+        await publisher.publish_state(IntelliChemState())
+
+        assert "intellichem2mqtt/intellichem/status.msgpack" not in client.batches[0]
+
+    async def test_msgpack_status(self):
+        """Test the state is also published as MessagePack when enabled."""
+        msgspec = pytest.importorskip("msgspec")
+        client = FakeMQTTClient()
+        publisher = StatePublisher(client, MQTTConfig(payload_format="msgpack"))
+
+        await publisher.publish_state(IntelliChemState(temperature=80))
+
+        batch = client.batches[0]
+        payload = batch["intellichem2mqtt/intellichem/status.msgpack"]
+        assert msgspec.msgpack.decode(payload) == batch["intellichem2mqtt/intellichem/status"]
+
+    def test_msgpack_requires_msgspec(self, monkeypatch):
+        """Test enabling MessagePack without msgspec fails at startup."""
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        with pytest.raises(ImportError, match="msgspec"):
+            StatePublisher(FakeMQTTClient(), MQTTConfig(payload_format="msgpack"))
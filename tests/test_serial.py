@@ -0,0 +1,69 @@
+"""Tests for the RS-485 serial connection."""
+
+import asyncio
+
+from intellichem2mqtt.config import SerialConfig
+from intellichem2mqtt.protocol.outbound import StatusRequestMessage
+from intellichem2mqtt.serial.buffer import PacketBuffer
+from intellichem2mqtt.serial.connection import RS485Connection
+
+
+def make_connection() -> tuple[RS485Connection, asyncio.StreamReader]:
+    """Create a connection reading from an in-memory stream."""
+    connection = RS485Connection(SerialConfig())
+    reader = asyncio.StreamReader()
+    connection._reader = reader
+    connection._connected = True
+    return connection, reader
+
+
+class TestReceivePacket:
+    """Tests for RS485Connection.receive_packet."""
+
+    async def test_packet_split_across_reads(self):
+        """Test a packet arriving in chunks is assembled."""
+        connection, reader = make_connection()
+        packet = StatusRequestMessage().to_bytes()
+
+        async def feed():
+            reader.feed_data(packet[:4])
+            await asyncio.sleep(0.01)
+            reader.feed_data(packet[4:])
+
+        feeder = asyncio.create_task(feed())
+        assert await connection.receive_packet(timeout=1.0) == packet
+        await feeder
+
+    async def test_timeout(self):
+        """Test None is returned when no packet arrives in time."""
+        connection, reader = make_connection()
+        reader.feed_data(b"\xff\x00")
+
+        assert await connection.receive_packet(timeout=0.01) is None
+
+    async def test_eof(self):
+        """Test None is returned straight away when the port closes."""
+        connection, reader = make_connection()
+        reader.feed_eof()
+
+        assert await connection.receive_packet(timeout=10) is None
+
+
+class TestPacketBuffer:
+    """Tests for PacketBuffer."""
+
+    def test_stats(self):
+        """Test received bytes, packets and bad checksums are counted."""
+        buffer = PacketBuffer()
+        packet = StatusRequestMessage().to_bytes()
+        corrupt = packet[:-1] + bytes([packet[-1] ^ 0xFF])
+
+        buffer.add_bytes(corrupt + packet)
+
+        assert buffer.get_packet() == packet
+        assert buffer.stats == {
+            "packets_received": 1,
+            "bytes_received": 2 * len(packet),
+            "invalid_checksums": 1,
+            "buffer_overflows": 0,
+        }